@@ -0,0 +1,146 @@
+"""Registry of simulation backends for TBLSimulator.
+
+Each backend declares the modules it needs. Availability is probed once per process
+without importing anything heavy (importlib.util.find_spec), and the real import only
+happens on first use or in warm_up(), which the app starts in a background thread so
+neither cold start nor the first click waits on TensorFlow.
+
+Only backends registered with custom_models=True run a TBLSimulator built from a
+custom ModelSpec (all the built-in ones do); available(sim) and get(name, sim) leave
+the others out for such a simulator.
+"""
+import functools
+import importlib
+import importlib.util
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class Backend:
+    name: str
+    label: str
+    run: Callable  # (sim, months, invest_rate, random_seed) -> TBLResult
+    paths: Optional[Callable] = None  # (sim, months, invest_rate, n_paths, random_seed) -> (3, n_paths, months)
+    integrate: Optional[Callable] = None  # (sim, econ_draws, social_draws, env_draws, invest_rate) -> (3, n_paths, months)
+    requires: tuple = ()
+    custom_models: bool = False  # runs simulators built from a custom ModelSpec
+
+
+_REGISTRY = {}
+_ready = set()
+_lock = threading.Lock()
+
+
+def register(backend):
+    """Add (or replace) a backend; later lookups see it immediately"""
+    _REGISTRY[backend.name] = backend
+    probe.cache_clear()
+    return backend
+
+
+def names():
+    return list(_REGISTRY)
+
+
+@functools.lru_cache(maxsize=None)
+def probe(name):
+    """(available, reason) for a backend, computed once per process"""
+    for module in _REGISTRY[name].requires:
+        if importlib.util.find_spec(module) is None:
+            return False, f'{module} is not installed'
+    return True, None
+
+
+def supports(name, sim):
+    """Whether backend `name` can run `sim` (None means the built-in model)"""
+    return sim is None or sim.spec is None or _REGISTRY[name].custom_models
+
+
+def available(sim=None):
+    """Installed backends, restricted to those able to run `sim` when given"""
+    return [name for name in _REGISTRY if probe(name)[0] and supports(name, sim)]
+
+
+def ready():
+    """Backends whose imports (and compiled kernels) are already loaded"""
+    with _lock:
+        return [name for name in _REGISTRY if name in _ready or not _REGISTRY[name].requires]
+
+
+def registered(name):
+    """Backend entry regardless of availability"""
+    return _REGISTRY[name]
+
+
+def get(name, sim=None):
+    if name not in _REGISTRY:
+        raise KeyError(f'unknown backend {name!r}, expected one of {names()}')
+    ok, reason = probe(name)
+    if not ok:
+        raise RuntimeError(f'backend {name!r} is unavailable: {reason}')
+    if not supports(name, sim):
+        raise NotImplementedError(f'backend {name!r} only implements the built-in model; '
+                                  f'custom ModelSpecs run on {[n for n in _REGISTRY if _REGISTRY[n].custom_models]}')
+    return _REGISTRY[name]
+
+
+def warm_up(which=None, background=True):
+    """Import heavy backends and run one tiny simulation to trigger compilation.
+
+    Returns the started thread when background=True.
+    """
+    def _warm():
+        from tbl_model import TBLSimulator
+        sim = TBLSimulator()
+        for name in which or available():
+            backend = _REGISTRY[name]
+            try:
+                for module in backend.requires:
+                    importlib.import_module(module)
+                backend.run(sim, 12, 0.1, 42)
+            except Exception:
+                continue
+            with _lock:
+                _ready.add(name)
+
+    if not background:
+        _warm()
+        return None
+    thread = threading.Thread(target=_warm, name='backend-warm-up', daemon=True)
+    thread.start()
+    return thread
+
+
+register(Backend(
+    name='python', label='Python (loop)',
+    run=lambda sim, months, invest_rate, random_seed: sim.standard_run(months, invest_rate, random_seed),
+    custom_models=True,
+))
+register(Backend(
+    name='numpy', label='NumPy',
+    run=lambda sim, months, invest_rate, random_seed: sim.numpy_run(months, invest_rate, random_seed),
+    paths=lambda sim, months, invest_rate, n_paths, random_seed:
+        sim.ensemble_paths(months, invest_rate, n_paths, random_seed),
+    integrate=lambda sim, *draws: sim.numpy_integrate(*draws),
+    custom_models=True,
+))
+register(Backend(
+    name='tensorflow', label='TensorFlow',
+    run=lambda sim, months, invest_rate, random_seed: sim.tensorflow_run(months, invest_rate, random_seed),
+    paths=lambda sim, months, invest_rate, n_paths, random_seed:
+        sim.tensorflow_paths(months, invest_rate, n_paths, random_seed),
+    integrate=lambda sim, *draws: sim.tensorflow_integrate(*draws),
+    requires=('tensorflow',),
+    custom_models=True,
+))
+register(Backend(
+    name='numba', label='Numba (JIT)',
+    run=lambda sim, months, invest_rate, random_seed: sim.numba_run(months, invest_rate, random_seed),
+    paths=lambda sim, months, invest_rate, n_paths, random_seed:
+        sim.numba_paths(months, invest_rate, n_paths, random_seed),
+    integrate=lambda sim, *draws: sim.numba_integrate(*draws),
+    requires=('numba',),
+    custom_models=True,
+))
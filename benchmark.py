@@ -0,0 +1,276 @@
+"""Benchmark harness for the TBLSimulator backends.
+
+Usable as a module or a CLI:
+
+    python benchmark.py --months 1200 --repeats 7 --scaling --output benchmark_results.json
+
+Each measurement warms up first (so TensorFlow import and graph tracing are never
+timed), then times `repeats` runs with time.perf_counter. The JSON output is what the
+app's speedup table reads, and can be diffed across releases.
+"""
+import argparse
+import importlib.metadata
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+import backends
+from tbl_model import TBLSimulator
+
+BENCHMARK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_results.json')
+
+
+def _run(backend, sim, months, invest_rate, n_paths):
+    if n_paths == 1:
+        return backend.run(sim, months, invest_rate, 42)
+    if backend.paths is None:
+        raise NotImplementedError(f'the {backend.label} backend simulates a single path')
+    return backend.paths(sim, months, invest_rate, n_paths, 42)
+
+
+def scaled_simulator(n_factors, dtype=np.float64):
+    """TBLSimulator with n_factors constituents split as evenly as possible across pillars"""
+    sim = TBLSimulator(dtype)
+    sizes = [n_factors // 3 + (i < n_factors % 3) for i in range(3)]
+    sim.econ_factors = {f'econ_{i}': 1.0 for i in range(sizes[0])}
+    sim.social_factors = {f'social_{i}': 1.0 for i in range(sizes[1])}
+    sim.env_factors = {f'env_{i}': 1.0 for i in range(sizes[2])}
+    sim.n_econ, sim.n_social, sim.n_env = sizes
+    return sim
+
+
+def time_backend(name, months=1200, invest_rate=0.1, n_paths=1, n_factors=None, repeats=5, warmup=1,
+                 dtype=np.float64, sim=None):
+    """Time one registered backend; returns a record with raw times and summary statistics.
+
+    Pass `sim` to time a specific simulator (e.g. one built from a custom ModelSpec)
+    instead of the built-in model. Failures (missing TensorFlow, a backend that cannot
+    run the model, ...) are reported in 'error' rather than hidden.
+    """
+    if sim is None:
+        sim = scaled_simulator(n_factors, dtype) if n_factors else TBLSimulator(dtype)
+    record = {'name': name, 'backend': backends.registered(name).label, 'months': months,
+              'invest_rate': invest_rate, 'n_paths': n_paths, 'dtype': sim.dtype.name, 'n_factors': sim.n_econ + sim.n_social + sim.n_env}
+    try:
+        backend = backends.get(name, sim)
+        for _ in range(warmup):
+            _run(backend, sim, months, invest_rate, n_paths)
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            _run(backend, sim, months, invest_rate, n_paths)
+            times.append(time.perf_counter() - start)
+    except Exception as e:
+        record['error'] = f'{type(e).__name__}: {e}'
+        return record
+    record.update({
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+    })
+    return record
+
+
+def scaling_curves(months=(120, 1200, 12000), n_paths=(1, 100, 1000), n_factors=(20, 60, 200),
+                   names=None, repeats=3, warmup=1, base_months=1200):
+    """Median timings of every backend along each axis, others held at their defaults"""
+    names = names or backends.names()
+    axes = {
+        'months': [dict(months=m) for m in months],
+        'n_paths': [dict(months=base_months, n_paths=n) for n in n_paths],
+        'n_factors': [dict(months=base_months, n_factors=n) for n in n_factors],
+    }
+    return {axis: [time_backend(name, repeats=repeats, warmup=warmup, **point)
+                   for point in points for name in names]
+            for axis, points in axes.items()}
+
+
+def replay_standard_draws(sim, months, random_seed=42):
+    """The exact draws standard_run consumes, shaped (1, months, n) for _integrate.
+
+    standard_run applies a shock before recording month 1, so the replay has one more
+    row than a vectorized run of the same horizon.
+    """
+    rng = np.random.RandomState(random_seed)
+    pillars, _ = sim._model()
+    draws = [np.empty((months, n)) for n in (sim.n_econ, sim.n_social, sim.n_env)]
+    for m in range(months):
+        for pillar, pillar_draws in zip(pillars, draws):
+            if pillar.distribution == 'normal':
+                pillar_draws[m] = [rng.normal(d, s) for d, s in zip(pillar.drift.tolist(), pillar.noise.tolist())]
+            elif pillar.affine:
+                pillar_draws[m] = [d + s * rng.random_sample()
+                                   for d, s in zip(pillar.drift.tolist(), pillar.noise.tolist())]
+            else:
+                pillar_draws[m] = [rng.random_sample() for _ in range(len(pillar.drift))]
+    return tuple(d[None] for d in draws)
+
+
+def check_equivalence(months=120, invest_rate=0.1, random_seed=42, rtol=1e-9, names=None, sim=None):
+    """Run standard_run's draw stream through every backend kernel and compare.
+
+    Returns the max relative error of each kernel against the Python loop, keyed by label.
+    Pass `sim` to check a specific simulator (e.g. one built from a custom ModelSpec).
+    """
+    sim = sim or TBLSimulator()
+    reference = sim.standard_run(months, invest_rate, random_seed).scores
+    draws = replay_standard_draws(sim, months, random_seed)
+    report = {}
+    for name in names or backends.names():
+        backend = backends.registered(name)
+        if backend.integrate is None:
+            continue
+        try:
+            scores = backends.get(name, sim).integrate(sim, *draws, invest_rate)[:, 0, 1:]
+        except Exception as e:
+            report[backend.label] = {'error': f'{type(e).__name__}: {e}'}
+            continue
+        error = float(np.max(np.abs(scores - reference) / np.abs(reference)))
+        report[backend.label] = {'max_rel_error': error, 'ok': error <= rtol}
+    return report
+
+
+def check_float32_accuracy(months=120, invest_rate=0.1, n_paths=200, random_seed=42):
+    """Accuracy of float32 mode against float64 on identical draws.
+
+    The float64 draws are rounded to float32 and pushed through the float32 kernel, so
+    the error is purely arithmetic precision (float32 has ~7 significant digits; expect
+    relative errors around 1e-6 at 120 months, growing slowly with the horizon). Months
+    where float32 overflows (environmental scores beyond ~3e38) are counted separately.
+    """
+    sim64, sim32 = TBLSimulator(np.float64), TBLSimulator(np.float32)
+    n_factors = sim64.n_econ + sim64.n_social + sim64.n_env
+    draws = sim64._draw(sim64._streams(random_seed), months-1, n_paths)
+    reference = sim64.numpy_integrate(*draws, invest_rate)
+    compact = sim32.numpy_integrate(*(d.astype(np.float32) for d in draws), invest_rate)
+    finite = np.isfinite(compact) & np.isfinite(reference)
+    error = np.abs(compact[finite] - reference[finite]) / np.abs(reference[finite])
+    final_tbl = lambda paths: paths[:, :, -1].mean(axis=0)
+    final_error = np.abs(final_tbl(compact) - final_tbl(reference)) / np.abs(final_tbl(reference))
+    return {
+        'months': months,
+        'n_paths': n_paths,
+        'max_rel_error': float(error.max()),
+        'median_rel_error': float(np.median(error)),
+        'final_tbl_max_rel_error': float(np.nanmax(final_error)),
+        'overflowed_fraction': float(1 - finite.mean()),
+        'bytes_per_path_month': {dtype: np.dtype(dtype).itemsize * n_factors for dtype in ('float64', 'float32')},
+    }
+
+
+def profile_backend(name, months=1200, invest_rate=0.1, n_paths=1, warmup=1):
+    """Per-phase breakdown of one backend run (see TBLSimulator.instrument).
+
+    Includes converting the result to the legacy list of dicts and to pandas, so
+    the records show where a whole app run spends its time.
+    """
+    sim = TBLSimulator()
+    backend = backends.get(name)
+    for _ in range(warmup):
+        _run(backend, sim, months, invest_rate, n_paths)
+    with sim.instrument() as stats:
+        result = _run(backend, sim, months, invest_rate, n_paths)
+        if n_paths == 1:
+            stats.measure('to_records', result.to_records)
+            stats.measure('to_pandas', result.to_pandas)
+    return [{'backend': backend.label, **record} for record in stats.records()]
+
+
+def _environment():
+    env = {'python': platform.python_version(), 'numpy': np.__version__,
+           'platform': platform.platform(), 'cpu_count': os.cpu_count()}
+    # Read installed versions from metadata so the report never imports TensorFlow itself
+    for dist in ('tensorflow', 'tensorflow-cpu'):
+        try:
+            env['tensorflow'] = importlib.metadata.version(dist)
+            break
+        except importlib.metadata.PackageNotFoundError:
+            env['tensorflow'] = None
+    return env
+
+
+def run_suite(months=1200, invest_rate=0.1, repeats=5, warmup=1, scaling=False, names=None):
+    """Full benchmark: headline timings, equivalence check and optional scaling curves"""
+    names = names or backends.names()
+    results = {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'environment': _environment(),
+        'config': {'months': months, 'invest_rate': invest_rate, 'repeats': repeats, 'warmup': warmup},
+        'backends': [time_backend(name, months, invest_rate, repeats=repeats, warmup=warmup)
+                     for name in names],
+        'equivalence': check_equivalence(invest_rate=invest_rate, names=names),
+        'float32_accuracy': check_float32_accuracy(invest_rate=invest_rate),
+    }
+    results['backends'] += [time_backend(name, months, invest_rate, repeats=repeats, warmup=warmup,
+                                         dtype=np.float32)
+                            for name in names if name != 'python']
+    if scaling:
+        results['scaling'] = scaling_curves(names=names, repeats=max(1, repeats // 2), warmup=warmup,
+                                            base_months=months)
+    return results
+
+
+def save_results(results, path=BENCHMARK_FILE):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path=BENCHMARK_FILE):
+    """Saved benchmark results, or None if the benchmark has not been run yet"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def median_times(results, dtype='float64'):
+    """{backend: median seconds} from a results dict, skipping failed backends"""
+    return {r['backend']: r['median'] for r in results['backends']
+            if 'median' in r and r.get('dtype', 'float64') == dtype}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark TBLSimulator backends.')
+    parser.add_argument('--months', type=int, default=1200)
+    parser.add_argument('--invest-rate', type=float, default=0.1)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--backend', action='append', choices=backends.names(),
+                        help='backend to run (repeatable, default: all)')
+    parser.add_argument('--scaling', action='store_true', help='also record scaling curves')
+    parser.add_argument('--phases', action='store_true', help='also print a per-phase breakdown per backend')
+    parser.add_argument('--output', default=BENCHMARK_FILE, help='JSON output path')
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.months, args.invest_rate, args.repeats, args.warmup, args.scaling, args.backend)
+    save_results(results, args.output)
+
+    for record in results['backends']:
+        label = f"{record['backend']} [{record['dtype']}]"
+        if 'error' in record:
+            print(f"{label:<25} failed: {record['error']}")
+        else:
+            print(f"{label:<25} median {record['median']:.4f}s  "
+                  f"min {record['min']:.4f}s  stdev {record['stdev']:.4f}s")
+    for name, check in results['equivalence'].items():
+        print(f"{name:<15} equivalence: {check}")
+    print(f"float32 vs float64: {results['float32_accuracy']}")
+    if args.phases:
+        for name in args.backend or backends.available():
+            for record in profile_backend(name, args.months, args.invest_rate):
+                print(f"{record['backend']:<15} {'  ' * record['depth'] + record['phase']:<30} "
+                      f"calls {record['calls']:>4}  total {record['total_s']:.5f}s  "
+                      f"self {record['self_s']:.5f}s  {record['bytes'] / 1e6:.2f} MB")
+    print(f'Wrote {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Shape-preserving decimation of series before they are charted.
+
+Plotly ships every point to the browser, so long horizons and ensemble bands are
+reduced here to a fixed budget first:
+
+    lttb()     Largest-Triangle-Three-Buckets: keeps the visually significant points of a line
+    minmax()   per-bucket minimum and maximum: keeps every extreme, suited to bands and spikes
+    decimate() clip several series to a month window, then reduce each to max_points
+
+Re-running decimate() on a narrower window is how zooming restores detail: the
+payload stays at max_points per series whatever the horizon.
+"""
+import numpy as np
+
+
+def lttb(y, n_out, x=None):
+    """Indices of the n_out points of y chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between contributes the
+    point forming the largest triangle with the previously kept point and the average of
+    the next bucket. Non-finite values are treated as maximally significant.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = slice(hi, edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+        cx, cy = x[nxt].mean(), y[nxt].mean()
+        with np.errstate(invalid='ignore', over='ignore'):
+            area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=np.inf)))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax(y, n_out):
+    """Sorted indices of the minimum and maximum of y in each of n_out // 2 buckets"""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(int)
+    bucket = np.repeat(np.arange(len(edges) - 1), np.diff(edges))
+    # Sorting by (bucket, value) leaves each bucket's minimum first and maximum last
+    order = np.lexsort((y, bucket))
+    return np.unique(np.concatenate([order[edges[:-1]], order[edges[1:] - 1]]))
+
+
+def decimate(x, series, max_points=1000, method='lttb', window=None):
+    """Reduce each of `series` (name -> array aligned with x) to at most max_points.
+
+    window is an inclusive (low, high) range of x to keep before reducing, e.g. the
+    zoomed month range. Returns {name: (x, y)}; every series keeps its own points.
+    """
+    x = np.asarray(x)
+    keep = slice(None)
+    if window is not None:
+        low, high = np.searchsorted(x, window[0], 'left'), np.searchsorted(x, window[1], 'right')
+        keep = slice(low, high)
+    x = x[keep]
+    reduced = {}
+    for name, y in series.items():
+        y = np.asarray(y)[keep]
+        if method == 'lttb':
+            index = lttb(y, max_points, x)
+        elif method == 'minmax':
+            index = minmax(y, max_points)
+        else:
+            raise ValueError(f"unknown method {method!r}; expected 'lttb' or 'minmax'")
+        reduced[name] = (x[index], y[index])
+    return reduced
@@ -0,0 +1,86 @@
+"""Memory-mapped on-disk ensembles, for runs larger than RAM.
+
+write_ensemble() streams per-factor trajectories chunk by chunk straight into .npy files
+opened with np.lib.format.open_memmap, so only one chunk is ever held in memory.
+open_ensemble() maps them back read-only; nothing is loaded until it is indexed.
+
+Directory layout:
+    metadata.json        run parameters and factor names
+    economic.npy         (n_paths, months, n_econ)
+    social.npy           (n_paths, months, n_social)
+    environmental.npy    (n_paths, months, n_env)
+    pillars.npy          (3, n_paths, months) pillar averages
+
+Peak memory is roughly n_paths * chunk_months * n_factors * itemsize, so lower
+chunk_months for very wide ensembles (e.g. 12 for 100k paths).
+"""
+import json
+import os
+
+import numpy as np
+
+from tbl_model import PILLARS, TBLSimulator
+
+
+def write_ensemble(directory, months, invest_rate, n_paths, random_seed=42, chunk_months=120, sim=None):
+    """Simulate an ensemble into `directory`; returns the opened EnsembleArchive"""
+    sim = sim or TBLSimulator()
+    os.makedirs(directory, exist_ok=True)
+    factor_names = dict(zip(PILLARS, (list(sim.econ_factors), list(sim.social_factors), list(sim.env_factors))))
+
+    factor_files = [
+        np.lib.format.open_memmap(os.path.join(directory, f'{name}.npy'), mode='w+', dtype=sim.dtype,
+                                  shape=(n_paths, months, len(factor_names[name])))
+        for name in PILLARS
+    ]
+    pillar_file = np.lib.format.open_memmap(os.path.join(directory, 'pillars.npy'), mode='w+',
+                                            dtype=sim.dtype, shape=(len(PILLARS), n_paths, months))
+    for month, factors in sim.stream_factors(months, invest_rate, n_paths, chunk_months, random_seed):
+        rows = slice(month[0] - 1, month[-1])
+        for i, (out, chunk) in enumerate(zip(factor_files, factors)):
+            out[:, rows] = chunk
+            pillar_file[i, :, rows] = chunk.mean(axis=-1)
+    for out in factor_files + [pillar_file]:
+        out.flush()
+    del factor_files, pillar_file
+
+    metadata = {'months': months, 'invest_rate': invest_rate, 'n_paths': n_paths, 'random_seed': random_seed,
+                'chunk_months': chunk_months, 'dtype': sim.dtype.name, 'factors': factor_names}
+    with open(os.path.join(directory, 'metadata.json'), 'w') as f:
+        json.dump(metadata, f, indent=2)
+    return open_ensemble(directory)
+
+
+def open_ensemble(directory):
+    return EnsembleArchive(directory)
+
+
+class EnsembleArchive:
+    """Lazy read-only view of an ensemble written by write_ensemble"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, 'metadata.json')) as f:
+            self.metadata = json.load(f)
+        self._arrays = {}
+
+    def _load(self, name):
+        if name not in self._arrays:
+            self._arrays[name] = np.load(os.path.join(self.directory, f'{name}.npy'), mmap_mode='r')
+        return self._arrays[name]
+
+    @property
+    def pillars(self):
+        """Pillar averages shaped (3, n_paths, months)"""
+        return self._load('pillars')
+
+    def pillar_factors(self, pillar):
+        """All constituents of one pillar shaped (n_paths, months, n_factors)"""
+        return self._load(pillar)
+
+    def factor(self, name):
+        """One named constituent (e.g. 'carbon_footprint') shaped (n_paths, months)"""
+        for pillar, names in self.metadata['factors'].items():
+            if name in names:
+                return self._load(pillar)[:, :, names.index(name)]
+        raise KeyError(f'unknown factor {name!r}')
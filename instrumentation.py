@@ -0,0 +1,150 @@
+"""Opt-in phase timing for TBLSimulator.
+
+    with sim.instrument() as stats:
+        sim.numpy_run(1200, 0.1)
+    stats.records()   # [{'path': 'numpy_run>ensemble_paths>_stream>_draw', 'calls': 1, ...}, ...]
+
+instrument() shadows the simulator's phase methods with timing wrappers on that one
+instance and removes them again on exit, so an uninstrumented simulator runs exactly
+the original code with no checks or hooks at all. Phases nest: each record is keyed
+by its call path and carries call counts, total and self (exclusive) seconds, and the
+bytes of the arrays the phase returned. Generator phases (_stream) are timed per
+yielded chunk. The Python loop, TensorFlow and Numba kernels are opaque, so they
+show up as a single phase each, next to the draws feeding them.
+"""
+import functools
+import inspect
+import sys
+import threading
+import time
+
+import numpy as np
+
+# Entry points, then the building blocks they are made of
+PHASES = (
+    'run', 'standard_run', 'numpy_run', 'resumable_run', 'extend', 'ensemble_paths', 'stream_paths',
+    'stream_run', 'summary_run', 'select_run', 'sweep', 'goal_seek',
+    'numpy_integrate', 'tensorflow_run', 'tensorflow_paths', 'tensorflow_integrate',
+    'numba_run', 'numba_paths', 'numba_integrate',
+    '_stream', '_draw', '_integrate', '_advance', '_cumulate', '_shocks', '_average',
+)
+
+
+def _nbytes(value):
+    """Approximate bytes held by a phase's return value (arrays, results, records)"""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.nbytes
+    if hasattr(value, 'scores'):  # TBLResult
+        return value.scores.nbytes + value.month.nbytes
+    if isinstance(value, tuple):
+        return sum(_nbytes(v) for v in value)
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value.values())
+    return 0
+
+
+class Instrumentation:
+    """Per-phase statistics for one instrumented simulator (thread-safe)"""
+
+    def __init__(self, sim=None, phases=PHASES):
+        self.sim = sim
+        self.phases = [name for name in phases if sim is None or hasattr(sim, name)]
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.detach()
+
+    def attach(self):
+        for name in self.phases:
+            method = getattr(self.sim, name)
+            wrap = self._wrap_generator if inspect.isgeneratorfunction(method) else self._wrap
+            setattr(self.sim, name, wrap(name, method))
+        return self
+
+    def detach(self):
+        """Drop the wrappers; the instance falls back to the plain class methods"""
+        for name in self.phases:
+            self.sim.__dict__.pop(name, None)
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _record(self, path, elapsed, child, nbytes):
+        with self._lock:
+            stats = self._stats[path]
+            stats['calls'] += 1
+            stats['total_s'] += elapsed
+            stats['self_s'] += elapsed - child
+            stats['max_s'] = max(stats['max_s'], elapsed)
+            stats['bytes'] += nbytes
+
+    def _timed(self, name, call, end=None):
+        """Run call() as phase `name`; a call returning the `end` sentinel (a generator
+        signalling exhaustion) is not counted"""
+        stack = self._stack()
+        path = '>'.join([frame[0] for frame in stack] + [name])
+        with self._lock:
+            # Registered on entry so records() lists parents before their children
+            self._stats.setdefault(path, {'calls': 0, 'total_s': 0.0, 'self_s': 0.0, 'max_s': 0.0, 'bytes': 0})
+        frame = [name, 0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        value = None
+        try:
+            value = call()
+            return value
+        finally:
+            # Failed calls are recorded too, so a run that raises can still be exported
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if end is None or value is not end:
+                if stack:
+                    stack[-1][1] += elapsed
+                self._record(path, elapsed, frame[1], _nbytes(value))
+
+    def _wrap(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            return self._timed(name, lambda: method(*args, **kwargs))
+        return wrapper
+
+    def _wrap_generator(self, name, method):
+        _done = object()
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            iterator = method(*args, **kwargs)
+            while True:
+                item = self._timed(name, lambda: next(iterator, _done), end=_done)
+                if item is _done:
+                    return
+                yield item
+        return wrapper
+
+    def measure(self, name, fn, *args, **kwargs):
+        """Time an arbitrary call as its own phase (e.g. result.to_records)"""
+        return self._timed(name, lambda: fn(*args, **kwargs))
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def records(self):
+        """One dict per call path, in first-call order (mean_s is NaN for calls still running)"""
+        with self._lock:
+            return [{'path': path, 'phase': path.rsplit('>', 1)[-1], 'depth': path.count('>'),
+                     **stats, 'mean_s': stats['total_s'] / stats['calls'] if stats['calls'] else float('nan')}
+                    for path, stats in self._stats.items()]
+
+    def to_pandas(self):
+        import pandas as pd
+        return pd.DataFrame(self.records())
@@ -0,0 +1,147 @@
+"""Portfolio mode: score many companies streamed from a CSV or Parquet file.
+
+Each row is one company:
+
+    company         identifier (optional, defaults to the row number)
+    invest_rate     required
+    months          horizon (optional, default 120)
+    <constituent>   starting value of any constituent, e.g. carbon_footprint (optional,
+                    missing columns or blank cells keep the simulator's defaults)
+
+The file is read chunk_size rows at a time and each chunk is simulated as one
+batched computation: starting values and invest rates broadcast per company, and
+shorter horizons are padded with neutral shocks up to the chunk's longest one.
+Company i draws from its own SeedSequence(random_seed, spawn_key=(i,)), so a
+company's scores do not depend on the chunk size or its neighbours, and equal
+numpy_run(months, invest_rate, that seed sequence) with the same starting values.
+
+    python portfolio.py suppliers.csv --output scores.csv --chunk-size 2000
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from tbl_model import PILLARS, TBLSimulator
+
+
+def read_companies(path, chunk_size=1000):
+    """Yield DataFrames of at most chunk_size company rows (Parquet requires pyarrow)"""
+    if os.path.splitext(path)[1].lower() in ('.parquet', '.pq'):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+def _start_values(sim, companies):
+    """Per-company starting factor vectors, one (n_companies, n_factors) array per pillar"""
+    state = []
+    for factors in (sim.econ_factors, sim.social_factors, sim.env_factors):
+        values = np.empty((len(companies), len(factors)), dtype=sim.dtype)
+        for i, (name, default) in enumerate(factors.items()):
+            column = companies[name] if name in companies else None
+            values[:, i] = default if column is None else column.fillna(default).to_numpy(dtype=sim.dtype)
+        state.append(values)
+    return tuple(state)
+
+
+SUMMARY_STATS = ('initial', 'final', 'mean', 'min', 'max', 'pct_change')
+
+
+def simulate_chunk(companies, sim=None, random_seed=42, first_row=0, default_months=120):
+    """Per-company summary DataFrame for one chunk of company rows.
+
+    Columns: company, invest_rate, months, then <output>_<stat> for every pillar and
+    'tbl' with SUMMARY_STATS (as in RunningSummary). An empty chunk gives an empty frame
+    with the same columns.
+    """
+    sim = sim or TBLSimulator()
+    n = len(companies)
+    rows = np.arange(first_row, first_row + n)
+    if not n:
+        return pd.DataFrame(columns=['company', 'invest_rate', 'months']
+                            + [f'{name}_{stat}' for name in PILLARS + ('tbl',) for stat in SUMMARY_STATS])
+    invest_rate = companies['invest_rate'].to_numpy(dtype=sim.dtype)
+    if np.isnan(invest_rate).any():
+        raise ValueError(f'invest_rate is missing (rows {rows[np.isnan(invest_rate)].tolist()})')
+    months = (companies['months'].fillna(default_months).to_numpy(dtype=int) if 'months' in companies
+              else np.full(n, default_months))
+    if (months < 1).any():
+        raise ValueError(f'horizons must be at least 1 month (rows {rows[months < 1].tolist()})')
+    steps = months.max() - 1
+
+    # Zero draws are neutral shocks (every factor is multiplied by 1), so padded months
+    # just hold each shorter-horizon company at its final value
+    draws = [np.zeros((n, steps, width), dtype=sim.dtype) for width in (sim.n_econ, sim.n_social, sim.n_env)]
+    for c, (row, horizon) in enumerate(zip(rows, months)):
+        streams = sim._streams(np.random.SeedSequence(random_seed, spawn_key=(int(row),)))
+        for padded, company_draws in zip(draws, sim._draw(streams, horizon - 1, 1)):
+            padded[c, :horizon - 1] = company_draws[0]
+
+    factors = sim._advance(_start_values(sim, companies), *draws, invest_rate[:, None, None])
+    pillars = np.stack([f.mean(axis=-1) for f in factors])
+    series = np.concatenate([pillars, pillars.mean(axis=0, keepdims=True)])
+    live = np.arange(steps + 1) < months[:, None]
+
+    summary = {'company': companies['company'].to_numpy() if 'company' in companies else rows,
+               'invest_rate': invest_rate, 'months': months}
+    for name, s in zip(PILLARS + ('tbl',), series):
+        initial, final = s[:, 0], s[np.arange(n), months - 1]
+        summary.update({
+            f'{name}_initial': initial,
+            f'{name}_final': final,
+            f'{name}_mean': np.where(live, s, 0).sum(axis=1) / months,
+            f'{name}_min': np.where(live, s, np.inf).min(axis=1),
+            f'{name}_max': np.where(live, s, -np.inf).max(axis=1),
+            f'{name}_pct_change': (final - initial) / initial * 100,
+        })
+    return pd.DataFrame(summary)
+
+
+def run_portfolio(path, chunk_size=1000, random_seed=42, sim=None, default_months=120):
+    """Yield one summary DataFrame per chunk of `path`, as soon as each chunk is scored"""
+    sim = sim or TBLSimulator()
+    first_row = 0
+    for companies in read_companies(path, chunk_size):
+        yield simulate_chunk(companies, sim, random_seed, first_row, default_months)
+        first_row += len(companies)
+
+
+def write_summaries(path, output, chunk_size=1000, random_seed=42, sim=None):
+    """Score `path` into `output` (.csv or .parquet) chunk by chunk; returns the company count"""
+    parquet = os.path.splitext(output)[1].lower() in ('.parquet', '.pq')
+    writer = None
+    count = 0
+    try:
+        for summary in run_portfolio(path, chunk_size, random_seed, sim):
+            if parquet:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(summary, preserve_index=False)
+                writer = writer or pq.ParquetWriter(output, table.schema)
+                writer.write_table(table)
+            else:
+                summary.to_csv(output, mode='a' if count else 'w', header=not count, index=False)
+            count += len(summary)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Score a portfolio of companies from a CSV or Parquet file.')
+    parser.add_argument('companies', help='CSV or Parquet file with one company per row')
+    parser.add_argument('--output', required=True, help='summary file (.csv or .parquet)')
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+    count = write_summaries(args.companies, args.output, args.chunk_size, args.seed)
+    print(f'Scored {count} companies into {args.output}')
+
+
+if __name__ == '__main__':
+    main()
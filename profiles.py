@@ -16,4 +16,25 @@ PROFILES = {
         "description": "UK potato packaging firm with steady, incremental sustainability gains.",
         "invest_rate": 0.05
     }
-}
\ No newline at end of file
+}
+
+# Display currencies with their conversion rate from USD
+CURRENCIES = {
+    'USD ($)': {'symbol': '$', 'rate': 1.0, 'name': 'US Dollar'},
+    'EUR (€)': {'symbol': '€', 'rate': 0.92, 'name': 'Euro'},
+    'GBP (£)': {'symbol': '£', 'rate': 0.79, 'name': 'British Pound'},
+    'INR (₹)': {'symbol': '₹', 'rate': 83.0, 'name': 'Indian Rupee'},
+    'JPY (¥)': {'symbol': '¥', 'rate': 150.0, 'name': 'Japanese Yen'},
+    'AUD (A$)': {'symbol': 'A$', 'rate': 1.52, 'name': 'Australian Dollar'},
+    'CAD (C$)': {'symbol': 'C$', 'rate': 1.35, 'name': 'Canadian Dollar'},
+    'CHF (Fr)': {'symbol': 'Fr', 'rate': 0.88, 'name': 'Swiss Franc'},
+    'CNY (¥)': {'symbol': '¥', 'rate': 7.2, 'name': 'Chinese Yuan'},
+    'BRL (R$)': {'symbol': 'R$', 'rate': 5.1, 'name': 'Brazilian Real'},
+    'KRW (₩)': {'symbol': '₩', 'rate': 1350.0, 'name': 'South Korean Won'},
+    'RUB (₽)': {'symbol': '₽', 'rate': 92.0, 'name': 'Russian Ruble'}
+}
+
+
+def investment_amount(revenue, invest_rate, currency):
+    """Monthly investment shown next to a scenario, in the scenario's currency"""
+    return revenue * (invest_rate / 100) * CURRENCIES[currency]['rate']
@@ -0,0 +1,253 @@
+"""Persistent result store shared by every app process on a machine.
+
+SQLite holds the metadata (indexed by profile, invest_rate and creation date) and
+each result as a compressed .npz blob. The database runs in WAL mode, so readers
+never block the single writer, and every operation opens its own short-lived
+connection, which makes one ResultStore safe to share across threads and any
+number of processes pointing at the same file.
+
+Results are keyed by result_key(): a hash of the kind of run, its parameters, the
+simulator configuration (dtype, TBLParams, starting factor values, ModelSpec) and
+MODEL_VERSION, so a model change never serves stale results. get_or_compute() (or
+claim() for results computed incrementally) claims a key before computing it, so
+identical scenarios run once fleet-wide while other processes wait for the result.
+"""
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import time
+import uuid
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+import numpy as np
+
+from tbl_model import MODEL_VERSION, TBLResult
+
+RESULT_STORE_FILE = os.environ.get(
+    'TBL_RESULT_STORE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tbl_results.sqlite'))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    model_version INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    profile TEXT,
+    invest_rate REAL,
+    months INTEGER,
+    seed INTEGER,
+    params TEXT NOT NULL,
+    created TEXT NOT NULL,
+    claimed_by TEXT,
+    claimed_at REAL,
+    data BLOB
+);
+CREATE INDEX IF NOT EXISTS results_profile ON results (profile, invest_rate);
+CREATE INDEX IF NOT EXISTS results_rate ON results (invest_rate);
+CREATE INDEX IF NOT EXISTS results_created ON results (created);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT,
+    profile TEXT,
+    invest_rate REAL,
+    created TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_created ON history (created);
+CREATE TABLE IF NOT EXISTS scenarios (
+    name TEXT PRIMARY KEY,
+    profile TEXT,
+    invest_rate REAL,
+    created TEXT NOT NULL,
+    spec TEXT NOT NULL
+);
+"""
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def simulator_config(sim):
+    """Everything about a TBLSimulator that changes its output"""
+    # Factors as ordered [name, start] pairs: result_key sorts dict keys, but the
+    # constituent order decides which draw each factor gets
+    config = {'dtype': sim.dtype.name, 'params': asdict(sim.params),
+              'factors': [list(f.items()) for f in (sim.econ_factors, sim.social_factors, sim.env_factors)]}
+    if sim.spec is not None:
+        # Only custom models add the key, so built-in results keep their existing keys
+        config['spec'] = sim.spec.to_dict()
+    return config
+
+
+def result_key(kind, sim=None, **params):
+    """Stable hex key for a run of `kind` with `params` on `sim`'s configuration"""
+    payload = {'model_version': MODEL_VERSION, 'kind': kind, 'params': params,
+               'sim': None if sim is None else simulator_config(sim)}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _pack(value):
+    buffer = io.BytesIO()
+    if isinstance(value, TBLResult):
+        np.savez_compressed(buffer, month=value.month, scores=value.scores, columns=np.array(value.columns))
+    else:
+        np.savez_compressed(buffer, array=np.asarray(value))
+    return buffer.getvalue()
+
+
+def _unpack(blob):
+    with np.load(io.BytesIO(blob)) as data:
+        if 'scores' in data:
+            return TBLResult(data['month'], data['scores'], tuple(str(c) for c in data['columns']))
+        return data['array']
+
+
+class ResultStore:
+    """SQLite + compressed-blob store for TBLResults and arrays (see module docstring)"""
+
+    def __init__(self, path=RESULT_STORE_FILE, lease_seconds=300, poll_seconds=0.1):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self.owner = uuid.uuid4().hex
+        with self._connect() as db:
+            db.execute('PRAGMA journal_mode=WAL')
+            db.executescript(_SCHEMA)
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.execute('PRAGMA busy_timeout=30000')
+        db.row_factory = sqlite3.Row
+        return _Closing(db)
+
+    def get(self, key, default=None):
+        with self._connect() as db:
+            row = db.execute('SELECT data FROM results WHERE key = ? AND data IS NOT NULL', (key,)).fetchone()
+        return default if row is None else _unpack(row['data'])
+
+    def put(self, key, value, kind='run', profile=None, invest_rate=None, months=None, seed=None, **params):
+        """Store value under key (the first complete write wins; results are deterministic)"""
+        meta = {'profile': profile, 'invest_rate': invest_rate, 'months': months, 'seed': seed, **params}
+        with self._connect() as db:
+            db.execute(
+                'INSERT INTO results (key, model_version, kind, profile, invest_rate, months, seed, params, '
+                'created, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET kind = excluded.kind, profile = excluded.profile, '
+                'invest_rate = excluded.invest_rate, months = excluded.months, seed = excluded.seed, '
+                'params = excluded.params, created = excluded.created, data = excluded.data, '
+                'claimed_by = NULL, claimed_at = NULL WHERE results.data IS NULL',
+                (key, MODEL_VERSION, kind, profile, invest_rate, months, seed,
+                 json.dumps(meta, sort_keys=True, default=str), _now(), _pack(value)))
+
+    def claim(self, key, kind='run'):
+        """Stored value for key, or None once this process has claimed the key.
+
+        While another process holds a live claim this waits for its result; a claim
+        older than lease_seconds (a crashed owner) is taken over. After None the caller
+        must put() the value, or release() the key if computing it fails.
+        """
+        while True:
+            with self._connect() as db:
+                db.execute('BEGIN IMMEDIATE')
+                row = db.execute('SELECT data, claimed_by, claimed_at FROM results WHERE key = ?',
+                                 (key,)).fetchone()
+                if row is not None and row['data'] is not None:
+                    db.execute('COMMIT')
+                    return _unpack(row['data'])
+                stale = row is None or row['claimed_at'] is None or \
+                    time.time() - row['claimed_at'] > self.lease_seconds
+                if stale:
+                    db.execute(
+                        'INSERT INTO results (key, model_version, kind, params, created, claimed_by, claimed_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET '
+                        'claimed_by = excluded.claimed_by, claimed_at = excluded.claimed_at',
+                        (key, MODEL_VERSION, kind, '{}', _now(), self.owner, time.time()))
+                db.execute('COMMIT')
+            if stale:
+                return None
+            time.sleep(self.poll_seconds)
+
+    def release(self, key):
+        """Drop this process's unfinished claim on key so another can compute it"""
+        with self._connect() as db:
+            db.execute('DELETE FROM results WHERE key = ? AND data IS NULL AND claimed_by = ?',
+                       (key, self.owner))
+
+    def get_or_compute(self, key, compute, **meta):
+        """Cached value, or compute() it once across every process sharing the file"""
+        value = self.claim(key, meta.get('kind', 'run'))
+        if value is not None:
+            return value
+        try:
+            value = compute()
+        except BaseException:
+            self.release(key)
+            raise
+        self.put(key, value, **meta)
+        return value
+
+    def find(self, profile=None, invest_rate=None, since=None, until=None, kind=None, limit=100):
+        """Metadata of stored results, newest first, filtered on the indexed columns"""
+        clauses, args = ['data IS NOT NULL'], []
+        for column, op, value in (('profile', '=', profile), ('invest_rate', '=', invest_rate),
+                                  ('created', '>=', since), ('created', '<', until), ('kind', '=', kind)):
+            if value is not None:
+                clauses.append(f'{column} {op} ?')
+                args.append(value)
+        query = ('SELECT key, model_version, kind, profile, invest_rate, months, seed, params, created '
+                 f"FROM results WHERE {' AND '.join(clauses)} ORDER BY created DESC LIMIT ?")
+        with self._connect() as db:
+            rows = db.execute(query, args + [limit]).fetchall()
+        return [{**dict(row), 'params': json.loads(row['params'])} for row in rows]
+
+    def add_history(self, record, key=None):
+        with self._connect() as db:
+            db.execute('INSERT INTO history (key, profile, invest_rate, created, record) VALUES (?, ?, ?, ?, ?)',
+                       (key, record.get('profile'), record.get('invest_rate'), _now(), json.dumps(record)))
+
+    def history(self, limit=50, profile=None):
+        """Most recent history records first"""
+        query = 'SELECT created, record FROM history'
+        args = []
+        if profile is not None:
+            query += ' WHERE profile = ?'
+            args.append(profile)
+        with self._connect() as db:
+            rows = db.execute(query + ' ORDER BY id DESC LIMIT ?', args + [limit]).fetchall()
+        return [{'created': row['created'], **json.loads(row['record'])} for row in rows]
+
+    def clear_history(self):
+        with self._connect() as db:
+            db.execute('DELETE FROM history')
+
+    def save_scenario(self, spec):
+        """Insert or replace a named scenario spec (as used by scenarios.py)"""
+        with self._connect() as db:
+            db.execute('INSERT OR REPLACE INTO scenarios (name, profile, invest_rate, created, spec) '
+                       'VALUES (?, ?, ?, ?, ?)',
+                       (spec['name'], spec.get('profile'), spec.get('invest_rate'), _now(), json.dumps(spec)))
+
+    def scenarios(self):
+        with self._connect() as db:
+            rows = db.execute('SELECT spec FROM scenarios ORDER BY created').fetchall()
+        return [json.loads(row['spec']) for row in rows]
+
+    def delete_scenario(self, name):
+        with self._connect() as db:
+            db.execute('DELETE FROM scenarios WHERE name = ?', (name,))
+
+
+class _Closing:
+    """Close the connection on exit (sqlite3's own context manager leaves it open)"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        return self.db
+
+    def __exit__(self, *exc):
+        self.db.close()
@@ -0,0 +1,217 @@
+"""Headless scenario runner: a CLI and a small local HTTP service.
+
+A scenario spec is a JSON object like the app's saved scenarios:
+
+    {"name": "dairy-15", "profile": "DairyCo (Balanced)", "invest_rate": 0.15,
+     "months": 240, "seed": 42, "currency": "EUR (€)", "revenue": 2000000}
+
+Everything but the profile is optional (invest_rate defaults to the profile's).
+Scenarios sharing (months, seed) only differ by invest_rate, so each such group is
+run as one TBLSimulator.sweep, split into batches of at most batch_size rates, and
+the batches go through a process pool. Results stream back as JSON lines in
+completion order; each line carries the spec's 'index' in the input.
+
+    python scenarios.py run specs.jsonl > results.jsonl
+    python scenarios.py serve --port 8765
+    curl -N --data-binary @specs.jsonl http://127.0.0.1:8765/scenarios
+"""
+import argparse
+import json
+import math
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from profiles import CURRENCIES, PROFILES, investment_amount
+from tbl_model import PILLARS, RunningSummary, TBLSimulator
+
+DEFAULTS = {'months': 120, 'seed': 42, 'currency': 'USD ($)', 'revenue': 1_000_000}
+
+
+def normalize(spec, index=0):
+    """Validated scenario with defaults filled in; raises ValueError on a bad spec"""
+    if not isinstance(spec, dict):
+        raise ValueError('a scenario must be a JSON object')
+    profile = spec.get('profile')
+    if profile is not None and profile not in PROFILES:
+        raise ValueError(f'unknown profile {profile!r}; expected one of {list(PROFILES)}')
+    scenario = {**DEFAULTS, 'name': f'scenario-{index}', 'profile': profile, **spec, 'index': index}
+    if scenario.get('invest_rate') is None:
+        if profile is None:
+            raise ValueError('a scenario needs a profile or an invest_rate')
+        scenario['invest_rate'] = PROFILES[profile]['invest_rate']
+    if scenario['currency'] not in CURRENCIES:
+        raise ValueError(f"unknown currency {scenario['currency']!r}; expected one of {list(CURRENCIES)}")
+    scenario['invest_rate'] = float(scenario['invest_rate'])
+    scenario['months'] = int(scenario['months'])
+    scenario['seed'] = int(scenario['seed'])
+    scenario['revenue'] = float(scenario['revenue'])
+    if scenario['months'] < 1:
+        raise ValueError('months must be at least 1')
+    if not scenario['revenue'] > 0:
+        raise ValueError('revenue must be a positive number')
+    return scenario
+
+
+def _batches(scenarios, batch_size):
+    groups = defaultdict(list)
+    for scenario in scenarios:
+        groups[scenario['months'], scenario['seed']].append(scenario)
+    for (months, seed), group in groups.items():
+        for start in range(0, len(group), batch_size):
+            yield months, seed, group[start:start + batch_size]
+
+
+def _run_batch(months, seed, invest_rates):
+    """Summary statistics for one (months, seed) group, each an array over invest_rates"""
+    sweep = TBLSimulator().sweep(invest_rates, seeds=(seed,), months=months, horizons=np.arange(1, months + 1))
+    summary = RunningSummary()
+    summary.update(np.stack([sweep[name][:, 0] for name in PILLARS]))
+    return summary.result()
+
+
+def _number(value):
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _result(scenario, summary, i):
+    result = {key: scenario[key] for key in ('index', 'name', 'profile', 'invest_rate', 'months', 'seed',
+                                             'currency', 'revenue')}
+    result['monthly_investment'] = investment_amount(scenario['revenue'], scenario['invest_rate'],
+                                                     scenario['currency'])
+    # Overflowed (infinite) scores become null so every line stays valid JSON
+    result['summary'] = {name: {stat: _number(values[i]) for stat, values in summary[name].items()}
+                         for name in PILLARS + ('tbl',)}
+    return result
+
+
+def run_scenarios(specs, max_workers=None, batch_size=256, pool=None):
+    """Yield one result dict per spec, in completion order.
+
+    Invalid specs yield {'index', 'error'} instead of stopping the batch. Pass an
+    existing ProcessPoolExecutor as `pool` to share workers across calls.
+    """
+    scenarios = []
+    for index, spec in enumerate(specs):
+        try:
+            scenarios.append(normalize(spec, index))
+        except (ValueError, TypeError) as e:
+            yield {'index': index, 'error': str(e)}
+
+    owned = pool is None
+    pool = pool or ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+    try:
+        futures = {pool.submit(_run_batch, months, seed, [s['invest_rate'] for s in batch]): batch
+                   for months, seed, batch in _batches(scenarios, batch_size)}
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                for scenario in batch:
+                    yield {'index': scenario['index'], 'error': f'{type(e).__name__}: {e}'}
+                continue
+            for i, scenario in enumerate(batch):
+                yield _result(scenario, summary, i)
+    finally:
+        if owned:
+            pool.shutdown(cancel_futures=True)
+
+
+def read_specs(text):
+    """Specs from a JSON array, a single JSON object, or JSON lines"""
+    text = text.strip()
+    if text.startswith('['):
+        return json.loads(text)
+    try:
+        return [json.loads(text)] if text else []
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class ScenarioHandler(BaseHTTPRequestHandler):
+    """POST /scenarios streams JSON lines; GET /profiles and GET /health are informational"""
+
+    pool = None
+    batch_size = 256
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/profiles':
+            self._send_json(200, {'profiles': PROFILES, 'currencies': list(CURRENCIES)})
+        else:
+            self._send_json(404, {'error': f'no route {self.path}'})
+
+    def do_POST(self):
+        if self.path != '/scenarios':
+            self._send_json(404, {'error': f'no route {self.path}'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            specs = read_specs(self.rfile.read(length).decode())
+        except (ValueError, UnicodeDecodeError) as e:
+            self._send_json(400, {'error': f'invalid request body: {e}'})
+            return
+        # No Content-Length: the response is streamed line by line and ends when the
+        # connection closes (HTTP/1.0 semantics), so clients see results as batches finish
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        for result in run_scenarios(specs, batch_size=self.batch_size, pool=self.pool):
+            self.wfile.write(json.dumps(result).encode() + b'\n')
+            self.wfile.flush()
+
+
+def serve(host='127.0.0.1', port=8765, max_workers=None, batch_size=256):
+    """Run the HTTP service until interrupted; one process pool serves every request"""
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        handler = type('Handler', (ScenarioHandler,), {'pool': pool, 'batch_size': batch_size})
+        with ThreadingHTTPServer((host, port), handler) as server:
+            print(f'Serving scenarios on http://{host}:{port}/scenarios', file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run TBL scenarios without the Streamlit app.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='run scenario specs and print JSON lines')
+    run.add_argument('specs', nargs='?', default='-', help='JSON or JSON-lines file (default: stdin)')
+    serve_cmd = commands.add_parser('serve', help='serve POST /scenarios over HTTP')
+    serve_cmd.add_argument('--host', default='127.0.0.1')
+    serve_cmd.add_argument('--port', type=int, default=8765)
+    for command in (run, serve_cmd):
+        command.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+        command.add_argument('--batch-size', type=int, default=256, help='max scenarios per sweep')
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        serve(args.host, args.port, args.workers, args.batch_size)
+        return
+    if args.specs == '-':
+        specs = read_specs(sys.stdin.read())
+    else:
+        with open(args.specs) as f:
+            specs = read_specs(f.read())
+    for result in run_scenarios(specs, args.workers, args.batch_size):
+        print(json.dumps(result), flush=True)
+
+
+if __name__ == '__main__':
+    main()
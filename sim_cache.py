@@ -0,0 +1,87 @@
+"""Bounded LRU cache for simulation results.
+
+One SimulationCache is meant to live for the whole server process (the app holds it in
+st.cache_resource), so every session and rerun shares it. Concurrent requests for the
+same key wait for the first computation instead of repeating it.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+def simulation_key(backend, months, invest_rate, random_seed=42, **options):
+    """Canonical cache key: equal parameters give equal keys regardless of spelling.
+
+    invest_rate is rounded so that e.g. 15 / 100 and 0.15 hit the same entry.
+    """
+    return (backend, int(months), round(float(invest_rate), 10), int(random_seed),
+            tuple(sorted(options.items())))
+
+
+class SimulationCache:
+    """Thread-safe LRU cache; cached results are shared, so treat them as read-only"""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._pending[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._pending[key]
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        return {'size': len(self._entries), 'maxsize': self.maxsize, 'hits': self.hits, 'misses': self.misses}
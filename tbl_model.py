@@ -1,8 +1,430 @@
+import functools
+from collections import Counter, namedtuple
+from dataclasses import asdict, dataclass, fields
+
 import numpy as np
-import time
 
-class TBLSimulator:
+PILLARS = ('economic', 'social', 'environmental')
+
+# Bump whenever a change alters simulated values; persisted results are keyed on it
+MODEL_VERSION = 1
+
+# One streamed block of months: pillar averages (3, n_paths, T), per-pillar factor
+# paths (n_paths, T, n), and the state/streams needed to continue
+_Chunk = namedtuple('_Chunk', 'month pillars factors state streams')
+
+
+class TBLResult:
+    """Columnar simulation result backed by contiguous NumPy arrays.
+
+    Scores live in one (n_columns, months) block, so every column is a contiguous
+    view and to_pandas()/to_arrow() wrap the data without copying. Integer indexing
+    and iteration still yield the old per-month dicts for code that expects a list.
+    """
+
+    def __init__(self, month, scores, columns=PILLARS):
+        self.month = np.asarray(month)
+        self.scores = np.ascontiguousarray(scores)
+        self.columns = tuple(columns)
+
+    def __len__(self):
+        return len(self.month)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key == 'month':
+                return self.month
+            return self.scores[self.columns.index(key)]
+        # Legacy list-of-dicts access
+        if isinstance(key, slice):
+            return [self._record(i) for i in range(len(self))[key]]
+        return self._record(key)
+
+    def __iter__(self):
+        return (self._record(i) for i in range(len(self)))
+
+    def _record(self, i):
+        record = {'month': int(self.month[i])}
+        record.update(zip(self.columns, self.scores[:, i]))
+        return record
+
+    def head(self, months):
+        """First `months` rows as views (streamed runs are prefix-consistent)"""
+        return TBLResult(self.month[:months], self.scores[:, :months], self.columns)
+
+    @classmethod
+    def concat(cls, results):
+        results = list(results)
+        return cls(np.concatenate([r.month for r in results]),
+                   np.concatenate([r.scores for r in results], axis=1), results[0].columns)
+
+    def summary(self):
+        """Final, mean, min/max and percent change per pillar (see RunningSummary)"""
+        summary = RunningSummary()
+        summary.update(np.stack([self[name] for name in PILLARS]))
+        return summary.result()
+
+    def to_records(self):
+        """Old list-of-dicts format"""
+        return list(self)
+
+    def to_pandas(self):
+        """DataFrame view over the score block (no copy of the scores)"""
+        import pandas as pd
+        df = pd.DataFrame(self.scores.T, columns=list(self.columns), copy=False)
+        df.insert(0, 'month', self.month)
+        return df
+
+    def to_arrow(self):
+        """pyarrow Table sharing the column buffers (requires pyarrow)"""
+        import pyarrow as pa
+        arrays = [pa.array(self.month)] + [pa.array(col) for col in self.scores]
+        return pa.Table.from_arrays(arrays, names=['month', *self.columns])
+
+
+class RunningSummary:
+    """Single-pass statistics over pillar chunks shaped (3, ..., months).
+
+    Keeps only O(1) numbers per series (and per path, for ensembles), so trajectories can
+    be discarded as soon as each chunk is folded in. The overall TBL index (mean of the
+    three pillars) is tracked alongside the pillars.
+    """
+
     def __init__(self):
+        self.months = 0
+        self.stats = None
+
+    def update(self, pillars):
+        series = np.concatenate([pillars, pillars.mean(axis=0, keepdims=True)])
+        if self.stats is None:
+            self.stats = {'initial': series[..., 0], 'final': series[..., -1], 'total': series.sum(axis=-1),
+                          'min': series.min(axis=-1), 'max': series.max(axis=-1)}
+        else:
+            self.stats['final'] = series[..., -1]
+            self.stats['total'] = self.stats['total'] + series.sum(axis=-1)
+            self.stats['min'] = np.minimum(self.stats['min'], series.min(axis=-1))
+            self.stats['max'] = np.maximum(self.stats['max'], series.max(axis=-1))
+        self.months += series.shape[-1]
+
+    def result(self):
+        stats = self.stats
+        result = {'months': self.months}
+        for i, name in enumerate(PILLARS + ('tbl',)):
+            result[name] = {
+                'initial': stats['initial'][i],
+                'final': stats['final'][i],
+                'mean': stats['total'][i] / self.months,
+                'min': stats['min'][i],
+                'max': stats['max'][i],
+                'pct_change': (stats['final'][i] - stats['initial'][i]) / stats['initial'][i] * 100,
+            }
+        return result
+
+
+class SimulationCheckpoint:
+    """Compact state for continuing a run: horizon, inputs, last factor vectors and RNG states.
+
+    to_dict() is JSON-serializable, so checkpoints can be stored next to results.
+    """
+
+    def __init__(self, months, invest_rate, n_paths, state, streams):
+        self.months = months
+        self.invest_rate = invest_rate
+        self.n_paths = n_paths
+        self.state = tuple(np.array(s) for s in state)
+        # Snapshot the bit generator states; the live Generators keep advancing
+        self.rng_states = [rng.bit_generator.state for rng in streams]
+
+    def generators(self):
+        """Fresh Generators positioned exactly where the checkpointed run stopped"""
+        generators = []
+        for rng_state in self.rng_states:
+            bit_generator = getattr(np.random, rng_state['bit_generator'])()
+            bit_generator.state = rng_state
+            generators.append(np.random.Generator(bit_generator))
+        return generators
+
+    def to_dict(self):
+        return {'months': self.months, 'invest_rate': self.invest_rate, 'n_paths': self.n_paths,
+                'state': [s.tolist() for s in self.state], 'rng_states': self.rng_states}
+
+    @classmethod
+    def from_dict(cls, data):
+        checkpoint = cls.__new__(cls)
+        checkpoint.months = data['months']
+        checkpoint.invest_rate = data['invest_rate']
+        checkpoint.n_paths = data['n_paths']
+        checkpoint.state = tuple(np.array(s) for s in data['state'])
+        checkpoint.rng_states = data['rng_states']
+        return checkpoint
+
+
+def ensemble_bands(paths, percentiles=(5, 50, 95)):
+    """Per-month mean and percentile bands from pillar paths shaped (3, n_paths, months)"""
+    result = {'month': np.arange(1, paths.shape[-1]+1), 'n_paths': paths.shape[1]}
+    for name, pillar in zip(PILLARS, paths):
+        bands = np.percentile(pillar, percentiles, axis=0)
+        result[name] = {'mean': pillar.mean(axis=0)}
+        result[name].update({f'p{p:g}': band for p, band in zip(percentiles, bands)})
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _tf_kernels(dtype='float64', structure=None):
+    """Build the compiled TensorFlow kernels once per process, dtype and model structure
+    (imports TF lazily).
+
+    structure is TBLSimulator._tf_structure(): the evaluation order plus, per pillar, its
+    distribution, whether draws are affine, and which pillars it reads as averages and
+    as individual constituents. Every input has a dynamic-shape signature, so the
+    graphs are traced exactly once per structure whatever the sizes and coefficients.
+    """
+    import tensorflow as tf
+
+    order, layout = structure
+    dtype = tf.as_dtype(dtype)
+    vector = tf.TensorSpec([None], dtype)
+    matrix = tf.TensorSpec([None, None], dtype)
+    draws = tf.TensorSpec([None, None, None], dtype)
+    # Per pillar: base, pillar couplings (n, 3), invest_rate ** exponent, constituent couplings
+    params = tuple((vector, tf.TensorSpec([None, len(PILLARS)], dtype), vector, tuple(matrix for _ in weighted))
+                   for _, _, _, weighted in layout)
+    triple = lambda spec: (spec,) * len(PILLARS)
+
+    def cumulate(start, shocks):
+        # Prepend the start row so the product runs in the same order as the NumPy kernel
+        start = tf.broadcast_to(start, tf.stack([tf.shape(shocks)[0], 1, tf.shape(start)[0]]))
+        return tf.math.cumprod(tf.concat([start, shocks], axis=1), axis=1)
+
+    @tf.function(input_signature=[triple(vector), triple(draws), params])
+    def integrate(starts, pillar_draws, pillar_params):
+        factors = [None] * len(PILLARS)
+        for p in order:
+            base, coupling, rates, weights = pillar_params[p]
+            _, _, averaged, weighted = layout[p]
+            scale = base
+            # Same term order as TBLSimulator._shocks: per driver, its average then its constituents
+            for q in sorted(set(averaged) | set(weighted)):
+                driver = factors[q][:, 1:]
+                if q in averaged:
+                    scale = scale + coupling[:, q] * tf.reduce_mean(driver, axis=2, keepdims=True)
+                if q in weighted:
+                    scale = scale + tf.einsum('ptj,ji->pti', driver, weights[weighted.index(q)])
+            factors[p] = cumulate(starts[p], 1 + scale * rates * pillar_draws[p])
+        return tf.stack([tf.reduce_mean(f, axis=2) for f in factors])
+
+    @tf.function(input_signature=[tf.TensorSpec([], tf.int64), tf.TensorSpec([], tf.int32),
+                                  tf.TensorSpec([], tf.int32), triple(vector), params,
+                                  triple((vector, vector))])
+    def simulate(seed, months, n_paths, starts, pillar_params, affine_params):
+        pillar_draws = []
+        for p, (distribution, affine, _, _) in enumerate(layout):
+            shape = tf.stack([n_paths, months - 1, tf.shape(starts[p])[0]])
+            if distribution == 'normal':
+                eps = tf.random.stateless_normal(shape, [seed, p], dtype=dtype)
+            else:
+                eps = tf.random.stateless_uniform(shape, [seed, p], dtype=dtype)
+            if affine:
+                drift, noise = affine_params[p]
+                eps = eps * noise + drift
+            pillar_draws.append(eps)
+        return integrate(starts, tuple(pillar_draws), pillar_params)
+
+    return simulate, integrate
+
+
+@dataclass(frozen=True)
+class TBLParams:
+    """Model coefficients; the defaults are the original calibration"""
+    econ_drift: float = 0.02  # mean monthly economic growth
+    econ_volatility: float = 0.01  # std dev of monthly economic growth
+    env_coupling: float = 0.05  # how strongly the social average drives environmental gains
+
+
+@dataclass(frozen=True)
+class Constituent:
+    """One factor of a ModelSpec.
+
+    Each month the factor grows by 1 + scale * (drift + noise * eps), where eps is the
+    pillar's draw (standard normal or uniform on [0, 1)) and
+    scale = (base + sum of coupling[target] * target's value this month) * invest_rate ** invest_exponent.
+    A coupling target is a pillar (its average) or another constituent (its value).
+    """
+    name: str
+    pillar: str
+    start: float = 1.0
+    drift: float = 0.0
+    noise: float = 1.0
+    invest_exponent: float = 0.0
+    base: float = 1.0
+    coupling: tuple = ()  # ((pillar or constituent name, coefficient), ...)
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """The model as data: named constituents plus one draw distribution per pillar.
+
+    Couplings read same-month values (pillar averages or individual constituents), so
+    the pillars they link must not form a cycle (a pillar cannot depend on itself,
+    directly or through others). from_dict() accepts the JSON form:
+
+        {"distributions": {"economic": "normal", "social": "uniform", "environmental": "uniform"},
+         "constituents": [{"name": "carbon_footprint", "pillar": "environmental", "base": 0,
+                           "invest_exponent": 1, "coupling": {"social": 0.05, "org_support": 0.01}}, ...]}
+    """
+    constituents: tuple
+    distributions: tuple = (('economic', 'normal'), ('social', 'uniform'), ('environmental', 'uniform'))
+
+    @classmethod
+    def builtin(cls, params=None, factors=None):
+        """The original model for TBLParams `params` and {pillar: {name: start}} `factors`"""
+        params = params or TBLParams()
+        if factors is None:
+            sim = TBLSimulator()
+            factors = dict(zip(PILLARS, (sim.econ_factors, sim.social_factors, sim.env_factors)))
+        dynamics = {
+            'economic': dict(drift=params.econ_drift, noise=params.econ_volatility),
+            'social': dict(invest_exponent=1),
+            'environmental': dict(invest_exponent=1, base=0, coupling=(('social', params.env_coupling),)),
+        }
+        return cls(tuple(Constituent(name, pillar, start, **dynamics[pillar])
+                         for pillar in PILLARS for name, start in factors[pillar].items()))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Spec from its JSON form; raises ValueError naming any unknown or missing field"""
+        unknown = set(data) - {'constituents', 'distributions'}
+        if unknown:
+            raise ValueError(f"unknown ModelSpec fields {sorted(unknown)}; expected 'constituents', 'distributions'")
+        allowed = [f.name for f in fields(Constituent)]
+        constituents = []
+        for i, c in enumerate(data.get('constituents', ())):
+            c = dict(c)
+            unknown = set(c) - set(allowed)
+            if unknown:
+                raise ValueError(f"constituent {c.get('name', i)!r} has unknown fields {sorted(unknown)}; "
+                                 f'expected {allowed}')
+            missing = [name for name in ('name', 'pillar') if name not in c]
+            if missing:
+                raise ValueError(f'constituent {c.get("name", i)!r} is missing {missing}')
+            c['coupling'] = tuple(sorted(dict(c.get('coupling', {})).items()))
+            constituents.append(Constituent(**c))
+        distributions = dict(data.get('distributions', {}))
+        if set(distributions) - set(PILLARS):
+            raise ValueError(f'unknown pillars in distributions {sorted(set(distributions) - set(PILLARS))}')
+        distributions = dict(cls.distributions, **distributions)
+        return cls(tuple(constituents), tuple((p, distributions[p]) for p in PILLARS))
+
+    def to_dict(self):
+        return {'distributions': dict(self.distributions),
+                'constituents': [dict(asdict(c), coupling=dict(c.coupling)) for c in self.constituents]}
+
+    def factors(self):
+        """{pillar: {name: start}} in constituent order"""
+        factors = {pillar: {} for pillar in PILLARS}
+        for c in self.constituents:
+            factors[c.pillar][c.name] = c.start
+        return factors
+
+    def coupling_matrix(self):
+        """Coupling coefficients shaped (n_constituents, 3 pillars + n_constituents).
+
+        Row i drives constituent i; the first columns hold the pillar-average couplings
+        and the rest the couplings to each constituent, in constituent order.
+        """
+        columns = {target: j for j, target in enumerate(PILLARS + tuple(c.name for c in self.constituents))}
+        matrix = np.zeros((len(self.constituents), len(columns)))
+        for i, c in enumerate(self.constituents):
+            for target, coefficient in c.coupling:
+                if target not in columns:
+                    raise ValueError(f'{c.name} is coupled to {target!r}, which is neither a pillar '
+                                     f'nor a constituent')
+                matrix[i, columns[target]] = coefficient
+        return matrix
+
+
+# Compiled per-pillar update: arrays over the pillar's constituents, or None where the
+# term is an identity (so the built-in model runs exactly the original arithmetic).
+# deps holds (driver pillar, average coefficient or None, (n_driver, n) weights or None);
+# dense is (base, pillar couplings (n, 3), constituent couplings (n, N), exponent) in full,
+# with constituent columns ordered economic, social, environmental, for the loop kernels
+_PillarModel = namedtuple('_PillarModel', 'distribution affine drift noise base deps exponent dense')
+
+
+@functools.lru_cache(maxsize=64)
+def _compile(spec, dtype):
+    """Per-pillar update arrays and a dependency-respecting evaluation order"""
+    dtype = np.dtype(dtype)
+    unknown = {c.pillar for c in spec.constituents} - set(PILLARS)
+    if unknown:
+        raise ValueError(f'unknown pillars {sorted(unknown)}; expected {list(PILLARS)}')
+    duplicates = sorted(name for name, count in Counter(c.name for c in spec.constituents).items() if count > 1)
+    if duplicates:
+        raise ValueError(f'constituent names must be unique; duplicated {duplicates}')
+    ambiguous = sorted({c.name for c in spec.constituents} & set(PILLARS))
+    if ambiguous:
+        raise ValueError(f'constituent names must not be pillar names; got {ambiguous}')
+    matrix = spec.coupling_matrix()
+    pillar_rows = [[i for i, c in enumerate(spec.constituents) if c.pillar == pillar] for pillar in PILLARS]
+    # Constituent columns in the order the simulator holds factors: pillar by pillar
+    columns = len(PILLARS) + np.array([i for rows in pillar_rows for i in rows], dtype=int)
+    pillars = []
+    for p, pillar in enumerate(PILLARS):
+        rows = pillar_rows[p]
+        if not rows:
+            raise ValueError(f'the {pillar} pillar has no constituents')
+        members = [spec.constituents[i] for i in rows]
+        distribution = dict(spec.distributions)[pillar]
+        if distribution not in ('normal', 'uniform'):
+            raise ValueError(f'unknown distribution {distribution!r} for {pillar}; expected normal or uniform')
+        column = lambda field: np.array([getattr(c, field) for c in members], dtype=dtype)
+        drift, noise, base, exponent = (column(field) for field in ('drift', 'noise', 'base', 'invest_exponent'))
+        deps = []
+        for d, driver_rows in enumerate(pillar_rows):
+            average = matrix[rows, d]
+            weights = matrix[np.ix_(rows, len(PILLARS) + np.array(driver_rows, dtype=int))]
+            if not (average.any() or weights.any()):
+                continue
+            if d == p:
+                raise ValueError(f'the {pillar} pillar cannot be coupled to itself')
+            # A coefficient shared by the whole pillar stays a scalar, so it multiplies one
+            # column of averages instead of a full (..., months, n) block
+            deps.append((d,
+                         None if not average.any() else
+                         dtype.type(average[0]) if (average == average[0]).all() else average.astype(dtype),
+                         weights.T.astype(dtype) if weights.any() else None))
+        deps = tuple(deps)
+        identity_base = 0 if deps else 1
+        pillars.append(_PillarModel(
+            distribution,
+            affine=bool(drift.any() or (noise != 1).any()),
+            drift=drift, noise=noise,
+            base=None if (base == identity_base).all() else base,
+            deps=deps,
+            exponent=0 if (exponent == 0).all() else 1 if (exponent == 1).all() else exponent,
+            dense=(base, matrix[rows, :len(PILLARS)].astype(dtype), matrix[np.ix_(rows, columns)].astype(dtype),
+                   exponent),
+        ))
+
+    order, pending = [], list(range(len(PILLARS)))
+    while pending:
+        ready = [p for p in pending if all(d in order for d, *_ in pillars[p].deps)]
+        if not ready:
+            raise ValueError(f'coupling between {[PILLARS[p] for p in pending]} forms a cycle')
+        order += ready
+        pending = [p for p in pending if p not in ready]
+    return tuple(pillars), tuple(order)
+
+
+class TBLSimulator:
+    def __init__(self, dtype=np.float64, params=None, spec=None):
+        self.params = params or TBLParams()
+        # A custom ModelSpec replaces the built-in model (and its TBLParams) on every backend
+        self.spec = spec
+        # float32 halves memory and bandwidth for large ensembles; standard_run always uses float64
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f'dtype must be float32 or float64, got {self.dtype}')
         # Economic constituents (7)
         self.econ_factors = {
             'profitability': 1.0,
@@ -32,118 +454,540 @@ class TBLSimulator:
             'carbon_labeling': 1.0,
             'biodiversity': 1.0
         }
+        if spec is not None:
+            factors = spec.factors()
+            self.econ_factors, self.social_factors, self.env_factors = (factors[p] for p in PILLARS)
         self.n_econ = len(self.econ_factors)
         self.n_social = len(self.social_factors)
         self.n_env = len(self.env_factors)
+        if spec is not None:
+            self._model()  # validate up front
+
+    def run(self, months, invest_rate, random_seed=42, backend='numpy'):
+        """Single-path run on any registered backend (see backends.py)"""
+        import backends
+        return backends.get(backend, self).run(self, months, invest_rate, random_seed)
 
     def standard_run(self, months, invest_rate, random_seed=42):
         """Pure Python loop (baseline)"""
         np.random.seed(random_seed)
+        pillars, order = self._model()
+        base, coupling, weights, rates, linked, _, offsets = (a.tolist() for a in self._dense(invest_rate))
+        drift = [x for pillar in pillars for x in pillar.drift.tolist()]
+        noise = [x for pillar in pillars for x in pillar.noise.tolist()]
+        members = [range(offsets[p], offsets[p+1]) for p in range(len(PILLARS))]
+        # Each factor's nonzero couplings as (coefficient, pillar, constituent or None for
+        # the pillar average), per driver pillar in the same order as the NumPy kernel
+        terms = [[(c, q, j) for q in range(len(PILLARS))
+                  for c, j in [(coupling[i][q], None)] + [(weights[i][j], j) for j in members[q] if linked[p][q]] if c]
+                 for p in range(len(PILLARS)) for i in members[p]]
         # Convert to lists for faster access (still Python loop)
-        econ = list(self.econ_factors.values())
-        social = list(self.social_factors.values())
-        env = list(self.env_factors.values())
+        factors = [*self.econ_factors.values(), *self.social_factors.values(), *self.env_factors.values()]
 
-        results = []
+        averages = [0.0] * len(PILLARS)
+        scores = np.empty((len(PILLARS), months))
         for m in range(months):
-            # Economic: small random walk
-            for i in range(self.n_econ):
-                econ[i] *= (1 + np.random.normal(0.02, 0.01))
-            # Social: influenced by investment
-            for i in range(self.n_social):
-                social[i] *= (1 + invest_rate * np.random.random())
-            # Environmental: influenced by social average
-            social_avg = sum(social) / self.n_social
-            for i in range(self.n_env):
-                env[i] *= (1 + 0.05 * social_avg * invest_rate * np.random.random())
-            # Record averages
-            results.append({
-                'month': m+1,
-                'economic': sum(econ)/self.n_econ,
-                'social': sum(social)/self.n_social,
-                'environmental': sum(env)/self.n_env
-            })
-        return results
+            # Draw every factor's shock in pillar order (economic, social, environmental)
+            shocks = []
+            for pillar, factors_p in zip(pillars, members):
+                for i in factors_p:
+                    if pillar.distribution == 'normal':
+                        shocks.append(np.random.normal(drift[i], noise[i]))
+                    elif pillar.affine:
+                        shocks.append(drift[i] + noise[i] * np.random.random())
+                    else:
+                        shocks.append(np.random.random())
+            # Grow each pillar after the pillars it reads have been updated this month
+            for p in order:
+                for i in members[p]:
+                    scale = base[i]
+                    for c, q, j in terms[i]:
+                        scale += c * (averages[q] if j is None else factors[j])
+                    factors[i] *= (1 + scale * rates[i] * shocks[i])
+                # Record averages
+                averages[p] = sum(factors[offsets[p]:offsets[p+1]]) / len(members[p])
+            scores[:, m] = averages
+        return TBLResult(np.arange(1, months+1), scores)
 
     def numpy_run(self, months, invest_rate, random_seed=42):
-        """Vectorized NumPy version"""
-        np.random.seed(random_seed)
-        # Pre-allocate arrays
-        econ = np.ones((months, self.n_econ))
-        social = np.ones((months, self.n_social))
-        env = np.ones((months, self.n_env))
-
-        # Generate random shocks in bulk
-        econ_shocks = 1 + np.random.normal(0.02, 0.01, (months-1, self.n_econ))
-        social_shocks = 1 + invest_rate * np.random.random((months-1, self.n_social))
-        # Cumulative products
-        econ[1:] = econ[0] * np.cumprod(econ_shocks, axis=0)
-        social[1:] = social[0] * np.cumprod(social_shocks, axis=0)
-
-        # Environmental depends on social average each month (cannot fully vectorize)
-        social_avg = np.mean(social, axis=1)
-        for i in range(1, months):
-            env[i] = env[i-1] * (1 + 0.05 * social_avg[i] * invest_rate * np.random.random(self.n_env))
-
-        # Compute average scores per month
-        econ_avg = np.mean(econ, axis=1)
-        social_avg = np.mean(social, axis=1)
-        env_avg = np.mean(env, axis=1)
-
-        results = [{'month': i+1, 'economic': econ_avg[i], 'social': social_avg[i], 'environmental': env_avg[i]}
-                   for i in range(months)]
-        return results
+        """Vectorized NumPy version (path 0 of ensemble_paths for the same seed)"""
+        return TBLResult(np.arange(1, months+1), self.ensemble_paths(months, invest_rate, 1, random_seed)[:, 0])
+
+    def resumable_run(self, months, invest_rate, random_seed=42, n_paths=None):
+        """numpy_run (or ensemble_paths with n_paths) that also returns a SimulationCheckpoint"""
+        chunk = next(self._stream(months, invest_rate, months, n_paths or 1, random_seed))
+        checkpoint = SimulationCheckpoint(months, invest_rate, n_paths, chunk.state, chunk.streams)
+        return (chunk.pillars if n_paths else TBLResult(chunk.month, chunk.pillars[:, 0])), checkpoint
+
+    def extend(self, checkpoint, months):
+        """Continue a checkpointed run to `months` in total, computing only the new months.
+
+        Returns (result for the new months only, new checkpoint); the new months are
+        bit-identical to the tail of a from-scratch run to the longer horizon.
+        """
+        if months <= checkpoint.months:
+            raise ValueError(f'cannot extend a {checkpoint.months}-month run to {months} months')
+        n_paths = checkpoint.n_paths
+        streams = checkpoint.generators()
+        chunk = next(self._stream(months, checkpoint.invest_rate, months, n_paths or 1, streams=streams,
+                                  state=checkpoint.state, done=checkpoint.months))
+        extended = SimulationCheckpoint(months, checkpoint.invest_rate, n_paths, chunk.state, chunk.streams)
+        return (chunk.pillars if n_paths else TBLResult(chunk.month, chunk.pillars[:, 0])), extended
+
+    def ensemble_run(self, months, invest_rate, n_paths=1000, random_seed=42, percentiles=(5, 50, 95)):
+        """Monte Carlo ensemble: n_paths independent paths in one vectorized pass.
+
+        Returns per-month mean and percentile bands for each pillar, e.g.
+        result['social']['p95'] is an array of length months.
+        """
+        paths = self.ensemble_paths(months, invest_rate, n_paths, random_seed)
+        return ensemble_bands(paths, percentiles)
+
+    def ensemble_paths(self, months, invest_rate, n_paths, random_seed=42):
+        """Per-path pillar averages shaped (3, n_paths, months).
+
+        random_seed is an int or np.random.SeedSequence; each run owns its streams and
+        nothing touches the global RNG. Identical to concatenating stream_paths() chunks.
+        """
+        return next(self._stream(months, invest_rate, months, n_paths, random_seed)).pillars
+
+    def stream_paths(self, months, invest_rate, n_paths, chunk_months=120, random_seed=42):
+        """Yield (month, paths) chunks of at most chunk_months, paths shaped (3, n_paths, chunk).
+
+        Only the last month's factor vectors are carried between chunks, so memory stays
+        constant in the horizon and the output is bit-identical to ensemble_paths().
+        """
+        for chunk in self._stream(months, invest_rate, chunk_months, n_paths, random_seed):
+            yield chunk.month, chunk.pillars
+
+    def stream_run(self, months, invest_rate, chunk_months=120, random_seed=42):
+        """Single-path stream_paths() yielding TBLResult chunks"""
+        for chunk in self._stream(months, invest_rate, chunk_months, 1, random_seed):
+            yield TBLResult(chunk.month, chunk.pillars[:, 0])
+
+    def summary_run(self, months, invest_rate, random_seed=42, n_paths=None, chunk_months=120):
+        """Final, mean, min/max and percent change per pillar without keeping trajectories.
+
+        Folds stream chunks into a RunningSummary, so memory is bounded by chunk_months
+        regardless of the horizon. With n_paths, every statistic is an array over paths.
+        """
+        summary = RunningSummary()
+        for chunk in self._stream(months, invest_rate, chunk_months, n_paths or 1, random_seed):
+            summary.update(chunk.pillars if n_paths else chunk.pillars[:, 0])
+        return summary.result()
+
+    def stream_factors(self, months, invest_rate, n_paths, chunk_months=120, random_seed=42):
+        """Like stream_paths, but yields (month, (econ, social, env)) per-constituent chunks
+        shaped (n_paths, chunk, n_factors) for the same streams"""
+        for chunk in self._stream(months, invest_rate, chunk_months, n_paths, random_seed):
+            yield chunk.month, chunk.factors
+
+    def select_run(self, months, invest_rate, outputs=PILLARS, random_seed=42, n_paths=None, chunk_months=120):
+        """Compute only the requested outputs, in the order given.
+
+        outputs may name pillars ('social'), constituents ('carbon_footprint') or 'tbl' (mean
+        of the three pillars). Pillars nobody asked for are never drawn or integrated, and
+        only the requested columns are kept; values match numpy_run / ensemble_paths for
+        the same seed. Returns a TBLResult, or an array shaped (n_outputs, n_paths, months)
+        when n_paths is given.
+        """
+        outputs = list(outputs)
+        needs = self._needed_pillars(outputs)
+        blocks = []
+        for chunk in self._stream(months, invest_rate, chunk_months, n_paths or 1, random_seed, needs=needs):
+            blocks.append(np.stack([self._select(chunk, name) for name in outputs]))
+        scores = np.concatenate(blocks, axis=-1)
+        if n_paths:
+            return scores
+        return TBLResult(np.arange(1, months+1), scores[:, 0], outputs)
+
+    def constituents(self):
+        """{constituent name: (pillar index, column)} across all pillars"""
+        index = {}
+        for p, factors in enumerate((self.econ_factors, self.social_factors, self.env_factors)):
+            index.update((name, (p, i)) for i, name in enumerate(factors))
+        return index
+
+    def _needed_pillars(self, outputs):
+        index = self.constituents()
+        needs = [False, False, False]
+        for name in outputs:
+            if name == 'tbl':
+                needs = [True, True, True]
+            elif name in PILLARS:
+                needs[PILLARS.index(name)] = True
+            elif name in index:
+                needs[index[name][0]] = True
+            else:
+                raise ValueError(f"unknown output {name!r}; expected a pillar, 'tbl' or one of {list(index)}")
+        # Coupled pillars need the pillars driving them (e.g. environmental needs social)
+        pillars, order = self._model()
+        for p in reversed(order):
+            if needs[p]:
+                for dep, *_ in pillars[p].deps:
+                    needs[dep] = True
+        return tuple(needs)
+
+    def _select(self, chunk, name):
+        if name == 'tbl':
+            return chunk.pillars.mean(axis=0)
+        if name in PILLARS:
+            return chunk.pillars[PILLARS.index(name)]
+        pillar, column = self.constituents()[name]
+        return chunk.factors[pillar][..., column]
+
+    def sweep(self, invest_rates, seeds=(42,), months=120, horizons=None):
+        """Evaluate a whole (invest_rate x seed) grid in one broadcasted pass.
+
+        Each seed uses the same streams as ensemble_run(n_paths=1, random_seed=seed), and
+        every invest rate reuses that seed's draws, so the surface is smooth in invest_rate.
+        Profiles only differ by invest_rate, so one sweep covers all of PROFILES.
+
+        Returns pillar and TBL scores shaped (rates, seeds, horizons), plus 'tbl_mean',
+        the seed-averaged response surface shaped (rates, horizons).
+        """
+        invest_rates = np.asarray(invest_rates, dtype=float)
+        seeds = np.asarray(seeds)
+        horizons = np.asarray([months] if horizons is None else horizons)
+
+        draws = zip(*(self._draw(self._streams(seed), months-1, 1) for seed in seeds))
+        econ_draws, social_draws, env_draws = (np.concatenate(d) for d in draws)
+
+        rates = invest_rates[:, None, None, None]
+        pillars = self._integrate(econ_draws, social_draws, env_draws, rates)
+        grid = (len(invest_rates), len(seeds), len(horizons))
+        result = {'invest_rate': invest_rates, 'seed': seeds, 'horizon': horizons}
+        for name, scores in zip(PILLARS, pillars):
+            result[name] = np.broadcast_to(scores[..., horizons - 1], grid)
+        result['tbl'] = (result['economic'] + result['social'] + result['environmental']) / 3
+        result['tbl_mean'] = result['tbl'].mean(axis=1)
+        return result
+
+    def goal_seek(self, target, output='tbl', month=120, confidence=None, n_paths=None, random_seed=42,
+                  rate_bounds=(0.0, 1.0), n_candidates=32, tol=1e-6, max_iter=20, profiles=None):
+        """Minimal invest_rate whose `output` score at `month` reaches `target`.
+
+        output is anything select_run accepts (a pillar, 'tbl' or a constituent). Without
+        confidence the score is the mean over n_paths (default 1, i.e. numpy_run's path);
+        with confidence=0.9 the target must be met on 90% of n_paths (default 1000) paths.
+
+        Each iteration scores n_candidates rates spread over the current bracket in one
+        batched pass, then narrows the bracket to the first crossing. Every candidate
+        reuses the same draws (common random numbers), and in the built-in model each
+        path's score is non-decreasing in invest_rate (a custom ModelSpec must keep that
+        property for the answer to be the minimal rate), so the search is deterministic and converges
+        geometrically. Pillars the output does not depend on are never simulated.
+
+        profiles maps names to dicts with an 'invest_rate' (like PROFILES); each profile's
+        current rate is scored on the same draws and reported with its shortfall.
+
+        Returns a dict with the rate found ('invest_rate', None when even rate_bounds[1]
+        falls short), its 'score', 'reached', 'iterations' and 'evaluations'.
+        """
+        if max_iter < 1:
+            raise ValueError(f'max_iter must be at least 1, got {max_iter}')
+        if n_paths is None:
+            n_paths = 1 if confidence is None else 1000
+        needs = self._needed_pillars([output])
+        draws = self._draw(self._streams(random_seed), month-1, n_paths, needs)
+        widest = max(self.n_econ, self.n_social, self.n_env)
+        batch = max(1, 2**22 // (n_paths * month * widest))
+
+        def score(rates):
+            rates = np.asarray(rates, dtype=self.dtype)
+            values = []
+            for start in range(0, len(rates), batch):
+                rate = rates[start:start + batch, None, None, None]
+                factors = self._advance(self._initial_state(), *draws, rate)
+                # Economic paths don't depend on the rate, so broadcast them across candidates
+                lead = (len(rate), n_paths)
+                final = tuple(None if f is None else np.broadcast_to(f[..., -1, :], lead + f.shape[-1:])
+                              for f in factors)
+                pillars = np.stack([np.full(lead, np.nan, dtype=self.dtype) if f is None else f.mean(axis=-1)
+                                    for f in final])
+                paths = self._select(_Chunk(None, pillars, final, None, None), output)
+                values.append(paths.mean(axis=-1) if confidence is None
+                              else np.quantile(paths, 1 - confidence, axis=-1))
+            return np.concatenate(values)
+
+        low, high = rate_bounds
+        result = {'target': target, 'output': output, 'month': month, 'confidence': confidence,
+                  'invest_rate': None, 'reached': False, 'iterations': 0, 'evaluations': 0}
+        while result['iterations'] < max_iter:
+            candidates = np.linspace(low, high, n_candidates)
+            scores = score(candidates)
+            result['iterations'] += 1
+            result['evaluations'] += n_candidates
+            hits = np.flatnonzero(scores >= target)
+            if not len(hits):
+                break
+            first = hits[0]
+            result.update(invest_rate=float(candidates[first]), score=float(scores[first]), reached=True)
+            if first == 0 or candidates[first] - candidates[first - 1] <= tol:
+                break
+            low, high = candidates[first - 1], candidates[first]
+        if not result['reached']:
+            result['score'] = float(scores[-1])
+
+        if profiles:
+            current = [p['invest_rate'] for p in profiles.values()]
+            result['profiles'] = {
+                name: {'invest_rate': rate, 'score': float(s), 'reached': bool(s >= target),
+                       'shortfall': None if result['invest_rate'] is None
+                       else max(0.0, result['invest_rate'] - rate)}
+                for name, rate, s in zip(profiles, current, score(current))
+            }
+        return result
+
+    def _stream(self, months, invest_rate, chunk_months, n_paths, random_seed=None, streams=None,
+                state=None, done=0, needs=(True, True, True)):
+        """Yield _Chunk records up to `months`, optionally resuming from state/streams/done.
+
+        Pillars switched off in `needs` are never drawn or integrated; their factors and
+        state are None and their pillar rows are NaN.
+        """
+        streams = streams or self._streams(random_seed)
+        state = state or self._initial_state()
+        while done < months:
+            # Month 1 is the initial state, every later month consumes one row of draws
+            first = done == 0
+            size = min(chunk_months, months - done)
+            draws = self._draw(streams, size - first, n_paths, needs)
+            factors = self._advance(state, *draws, invest_rate)
+            state = tuple(None if f is None else f[..., -1, :].copy() for f in factors)
+            rows = slice(None) if first else slice(1, None)
+            factors = tuple(None if f is None else f[..., rows, :] for f in factors)
+            pillars = self._average(factors, (n_paths, size))
+            yield _Chunk(np.arange(done+1, done+size+1), pillars, factors, state, streams)
+            done += size
+
+    @staticmethod
+    def _streams(random_seed):
+        """One Generator per pillar, so each pillar's draws never depend on the others' shapes"""
+        if not isinstance(random_seed, np.random.SeedSequence):
+            random_seed = np.random.SeedSequence(random_seed)
+        return [np.random.default_rng(child) for child in random_seed.spawn(len(PILLARS))]
+
+    def _draw(self, streams, n_months, n_paths, needs=(True, True, True)):
+        """Next n_months of draws from each needed pillar stream, shaped (n_paths, n_months, n_factors).
+
+        Draws are taken month-major, so a horizon split into chunks consumes every stream
+        in exactly the same order as one bulk draw. Skipped pillars get None and leave
+        their stream untouched.
+        """
+        pillars, _ = self._model()
+        draws = []
+        for rng, pillar, n, need in zip(streams, pillars, (self.n_econ, self.n_social, self.n_env), needs):
+            if not need:
+                draws.append(None)
+                continue
+            if pillar.distribution == 'normal':
+                eps = rng.standard_normal((n_months, n_paths, n), dtype=self.dtype)
+            else:
+                eps = rng.random((n_months, n_paths, n), dtype=self.dtype)
+            if pillar.affine:
+                eps = pillar.drift + pillar.noise * eps
+            draws.append(eps.swapaxes(0, 1))
+        return tuple(draws)
+
+    def _model(self):
+        """Compiled update for self.spec, or for the built-in model with the current
+        params and factor dicts.
+
+        _draw and _advance ask for it on every chunk, so the compiled model is kept on
+        the instance and only rebuilt when the configuration it came from changes.
+        """
+        if self.spec is None:
+            config = (self.params, self.dtype, tuple(self.econ_factors.items()),
+                      tuple(self.social_factors.items()), tuple(self.env_factors.items()))
+        else:
+            config = (self.spec, self.dtype)
+        cached = self.__dict__.get('_compiled')
+        if cached is not None and cached[0] == config:
+            return cached[1]
+        spec = self.spec
+        if spec is None:
+            factors = dict(zip(PILLARS, (self.econ_factors, self.social_factors, self.env_factors)))
+            spec = ModelSpec.builtin(self.params, factors)
+        model = _compile(spec, self.dtype.name)
+        self._compiled = (config, model)
+        return model
+
+    def _dense(self, invest_rate):
+        """The compiled model as flat arrays over all factors (economic, then social, then
+        environmental) for the loop kernels.
+
+        Returns base, pillar couplings (N, 3), constituent couplings (N, N),
+        invest_rate ** exponent, whether each pillar reads another's constituents (3, 3),
+        the evaluation order and each pillar's offsets into the factor vector.
+        """
+        pillars, order = self._model()
+        base, coupling, weights, exponent = (np.concatenate(parts) for parts in zip(*(p.dense for p in pillars)))
+        linked = np.array([[any(d == q and w is not None for d, _, w in pillar.deps) for q in range(len(PILLARS))]
+                           for pillar in pillars])
+        offsets = np.cumsum([0, self.n_econ, self.n_social, self.n_env])
+        return (base, coupling, weights, self.dtype.type(invest_rate) ** exponent, linked, np.array(order),
+                offsets)
+
+    def _tf_structure(self):
+        """Hashable model layout keying the compiled TF kernels, plus their per-pillar inputs"""
+        pillars, order = self._model()
+        layout, params, affine = [], [], []
+        for pillar in pillars:
+            base, coupling, _, _ = pillar.dense
+            layout.append((pillar.distribution, pillar.affine, tuple(d for d, c, _ in pillar.deps if c is not None),
+                           tuple(d for d, _, w in pillar.deps if w is not None)))
+            params.append((base, coupling, tuple(w for _, _, w in pillar.deps if w is not None)))
+            affine.append((pillar.drift, pillar.noise))
+        return (order, tuple(layout)), params, tuple(affine)
+
+    def _tf_params(self, params, invest_rate):
+        rate = self.dtype.type(invest_rate)
+        return tuple((base, coupling, rate ** pillar.dense[3], weights)
+                     for (base, coupling, weights), pillar in zip(params, self._model()[0]))
+
+    def _initial_state(self):
+        return tuple(np.fromiter(factors.values(), dtype=self.dtype, count=len(factors))
+                     for factors in (self.econ_factors, self.social_factors, self.env_factors))
+
+    def _integrate(self, econ_draws, social_draws, env_draws, invest_rate):
+        """Turn raw draws shaped (..., months-1, n_factors) into pillar averages shaped (..., months).
+
+        Leading dimensions (paths, grid points, ...) are carried through untouched, and
+        invest_rate may be any array that broadcasts against them.
+        """
+        factors = self._advance(self._initial_state(), econ_draws, social_draws, env_draws, invest_rate)
+        return tuple(f.mean(axis=-1) for f in factors)
+
+    def _advance(self, state, econ_draws, social_draws, env_draws, invest_rate, coupling=None):
+        """Step (econ, social, env) factor vectors forward through draws shaped (..., T, n).
+
+        Returns the factor paths shaped (..., T+1, n), starting with the given state row.
+        A pillar whose draws are None is skipped (coupled pillars need their drivers).
+        coupling maps (pillar, driver pillar) names to a coefficient replacing the model's
+        pillar-average coupling for every constituent of that pillar, e.g.
+        {('environmental', 'social'): 0.08}; like invest_rate, coefficients may be arrays
+        broadcasting over leading dims.
+        """
+        # Keep float32 runs in float32 even when invest_rate arrives as a float64 array
+        invest_rate = np.asarray(invest_rate, dtype=self.dtype)
+        pillars, order = self._model()
+        overrides = [{}, {}, {}]
+        for (pillar, driver), coefficient in (coupling or {}).items():
+            p, d = PILLARS.index(pillar), PILLARS.index(driver)
+            if all(dep != d for dep, *_ in pillars[p].deps):
+                raise ValueError(f'the model has no {driver} -> {pillar} coupling to override')
+            overrides[p][d] = np.asarray(coefficient, dtype=self.dtype)
+        draws = (econ_draws, social_draws, env_draws)
+        factors = [None, None, None]
+        for p in order:
+            if draws[p] is not None:
+                # Coupled pillars read values that are already known for every month, so
+                # each month's growth is fixed up front and the recurrence is one cumprod
+                shocks = self._shocks(pillars[p], factors, draws[p], invest_rate, overrides[p])
+                factors[p] = self._cumulate(state[p], shocks)
+        return tuple(factors)
+
+    def _shocks(self, pillar, factors, draws, invest_rate, overrides=None):
+        """Monthly growth factors of one pillar: 1 + scale * draws, where scale is the base
+        plus the coupled same-month values, times invest_rate ** exponent.
+
+        overrides maps driver pillar indices to replacement average coefficients.
+        """
+        scale = pillar.base
+        for dep, coefficient, weights in pillar.deps:
+            if overrides and dep in overrides:
+                coefficient = overrides[dep]
+            if coefficient is not None:
+                term = coefficient * factors[dep][..., 1:, :].mean(axis=-1)[..., None]
+                scale = term if scale is None else scale + term
+            if weights is not None:
+                # Constituent-level coupling: one (n_driver, n) matrix product per month
+                term = factors[dep][..., 1:, :] @ weights
+                scale = term if scale is None else scale + term
+        if isinstance(pillar.exponent, np.ndarray):
+            rate = invest_rate ** pillar.exponent
+            scale = rate if scale is None else scale * rate
+        elif pillar.exponent == 1:
+            scale = invest_rate if scale is None else scale * invest_rate
+        return 1 + draws if scale is None else 1 + scale * draws
+
+    def _average(self, factors, shape):
+        """Pillar averages shaped (3, *shape); skipped pillars (None) are NaN"""
+        pillars = np.full((len(PILLARS),) + shape, np.nan, dtype=self.dtype)
+        for i, f in enumerate(factors):
+            if f is not None:
+                pillars[i] = f.mean(axis=-1)
+        return pillars
+
+    @staticmethod
+    def _cumulate(start, shocks):
+        """Running product of shocks from start; the start row is included so chunked
+        and bulk runs multiply in exactly the same order"""
+        lead = np.broadcast_shapes(np.shape(start)[:-1], shocks.shape[:-2])
+        path = np.empty(lead + (shocks.shape[-2] + 1, shocks.shape[-1]), dtype=shocks.dtype)
+        path[..., 0, :] = start
+        path[..., 1:, :] = shocks
+        return np.cumprod(path, axis=-2, out=path)
+
+    def numpy_integrate(self, econ_draws, social_draws, env_draws, invest_rate):
+        """Pillar paths shaped (3, ..., months) from caller-supplied draws"""
+        return np.stack(self._integrate(econ_draws, social_draws, env_draws, invest_rate))
 
     def tensorflow_run(self, months, invest_rate, random_seed=42):
-        """TensorFlow version (GPU if available)"""
-        import tensorflow as tf
-        tf.random.set_seed(random_seed)
-        # Use TensorFlow for vectorized operations
-        # For simplicity, we'll implement the same logic as numpy but with tf ops
-        # This can run on GPU automatically
-        econ = tf.ones((months, self.n_econ), dtype=tf.float64)
-        social = tf.ones((months, self.n_social), dtype=tf.float64)
-        env = tf.ones((months, self.n_env), dtype=tf.float64)
-
-        econ_shocks = 1 + tf.random.normal((months-1, self.n_econ), mean=0.02, stddev=0.01, dtype=tf.float64)
-        social_shocks = 1 + invest_rate * tf.random.uniform((months-1, self.n_social), dtype=tf.float64)
-
-        # Cumulative product (custom loop because tf.cumprod is 1D per column, we can do manually)
-        # Simpler: use numpy within tf.function? No, we want graph. We'll do a loop (still fast on GPU)
-        for i in tf.range(1, months):
-            econ = tf.tensor_scatter_nd_update(econ, [[i]], [econ[i-1] * econ_shocks[i-1]])
-            social = tf.tensor_scatter_nd_update(social, [[i]], [social[i-1] * social_shocks[i-1]])
-
-        social_avg = tf.reduce_mean(social, axis=1)
-        for i in tf.range(1, months):
-            env = tf.tensor_scatter_nd_update(env, [[i]], [env[i-1] * (1 + 0.05 * social_avg[i] * invest_rate * tf.random.uniform((self.n_env,), dtype=tf.float64))])
-
-        econ_avg = tf.reduce_mean(econ, axis=1).numpy()
-        social_avg = tf.reduce_mean(social, axis=1).numpy()
-        env_avg = tf.reduce_mean(env, axis=1).numpy()
-
-        results = [{'month': i+1, 'economic': econ_avg[i], 'social': social_avg[i], 'environmental': env_avg[i]}
-                   for i in range(months)]
-        return results
-
-    def benchmark(self, months=1200, invest_rate=0.1):
-        """Run all three versions and return timing"""
-        times = {}
-        # Standard
-        start = time.time()
-        self.standard_run(months, invest_rate)
-        times['Python (loop)'] = time.time() - start
-
-        # NumPy
-        start = time.time()
-        self.numpy_run(months, invest_rate)
-        times['NumPy'] = time.time() - start
-
-        # TensorFlow (if available)
-        try:
-            start = time.time()
-            self.tensorflow_run(months, invest_rate)
-            times['TensorFlow'] = time.time() - start
-        except Exception as e:
-            times['TensorFlow'] = None
-        return times
\ No newline at end of file
+        """TensorFlow version (graph-compiled, GPU if available)"""
+        return TBLResult(np.arange(1, months+1), self.tensorflow_paths(months, invest_rate, 1, random_seed)[:, 0])
+
+    def tensorflow_paths(self, months, invest_rate, n_paths, random_seed=42):
+        """Batched TensorFlow ensemble: pillar paths shaped (3, n_paths, months).
+
+        Draws come from TF's stateless RNG, so runs are reproducible per seed but not
+        equal to the NumPy streams. Shapes are dynamic in the compiled signature, so
+        repeated calls reuse one graph whatever months and n_paths are.
+        """
+        structure, params, affine = self._tf_structure()
+        simulate, _ = _tf_kernels(self.dtype.name, structure)
+        paths = simulate(random_seed, months, n_paths, self._initial_state(), self._tf_params(params, invest_rate),
+                         affine)
+        return paths.numpy()
+
+    def tensorflow_integrate(self, econ_draws, social_draws, env_draws, invest_rate):
+        """Compiled TF counterpart of _integrate for draws shaped (n_paths, months-1, n).
+
+        Lets the TF kernel be cross-checked against NumPy on identical draws.
+        """
+        structure, params, _ = self._tf_structure()
+        _, integrate = _tf_kernels(self.dtype.name, structure)
+        return integrate(self._initial_state(), (econ_draws, social_draws, env_draws),
+                         self._tf_params(params, invest_rate)).numpy()
+
+    def numba_run(self, months, invest_rate, random_seed=42):
+        """Numba JIT version (requires numba; same streams as numpy_run)"""
+        return TBLResult(np.arange(1, months+1), self.numba_paths(months, invest_rate, 1, random_seed)[:, 0])
+
+    def numba_paths(self, months, invest_rate, n_paths, random_seed=42):
+        """Compiled-loop counterpart of ensemble_paths, parallel across paths"""
+        draws = self._draw(self._streams(random_seed), months-1, n_paths)
+        return self.numba_integrate(*draws, invest_rate)
+
+    def numba_integrate(self, econ_draws, social_draws, env_draws, invest_rate):
+        """Compiled-loop counterpart of numpy_integrate for draws shaped (n_paths, months-1, n)"""
+        import jit_backend
+        return jit_backend.integrate(econ_draws, social_draws, env_draws, np.concatenate(self._initial_state()),
+                                     *self._dense(invest_rate))
+
+    def instrument(self, phases=None):
+        """Record per-phase timings, call counts and allocation sizes on this instance.
+
+        Returns an Instrumentation (see instrumentation.py); use it as a context manager
+        to remove the hooks again. Uninstrumented simulators carry no hooks at all.
+        """
+        import instrumentation
+        return instrumentation.Instrumentation(self, phases or instrumentation.PHASES).attach()
+
+    def benchmark(self, months=1200, invest_rate=0.1, repeats=3):
+        """Median seconds per backend label (None if it failed); see benchmark.py for the full harness"""
+        import backends
+        import benchmark
+        records = [benchmark.time_backend(name, months, invest_rate, repeats=repeats) for name in backends.names()]
+        return {r['backend']: r.get('median') for r in records}
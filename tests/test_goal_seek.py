@@ -0,0 +1,24 @@
+import pytest
+
+from tbl_model import TBLSimulator
+
+
+def test_goal_seek_finds_minimal_rate():
+    sim = TBLSimulator()
+    result = sim.goal_seek(5.0, month=60, tol=1e-6)
+    assert result['reached']
+    assert result['score'] >= 5.0
+    assert sim.numpy_run(60, result['invest_rate']).scores[:, -1].mean() == pytest.approx(result['score'])
+    below = sim.goal_seek(5.0, month=60, rate_bounds=(0.0, result['invest_rate'] - 1e-4))
+    assert not below['reached']
+
+
+def test_goal_seek_unreachable_target():
+    result = TBLSimulator().goal_seek(1e30, month=24)
+    assert result['invest_rate'] is None and not result['reached']
+
+
+@pytest.mark.parametrize('max_iter', [0, -1])
+def test_goal_seek_rejects_max_iter_below_one(max_iter):
+    with pytest.raises(ValueError, match='max_iter'):
+        TBLSimulator().goal_seek(1.5, max_iter=max_iter)
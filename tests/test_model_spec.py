@@ -0,0 +1,133 @@
+import importlib.util
+
+import numpy as np
+import pytest
+
+import backends
+import benchmark
+import sensitivity
+from tbl_model import PILLARS, Constituent, ModelSpec, TBLParams, TBLSimulator
+
+requires_numba = pytest.mark.skipif(importlib.util.find_spec('numba') is None, reason='numba is not installed')
+requires_tf = pytest.mark.skipif(importlib.util.find_spec('tensorflow') is None,
+                                 reason='tensorflow is not installed')
+
+
+def coupled_spec():
+    """Small custom model using every kind of coupling, exponent and distribution"""
+    return ModelSpec((
+        Constituent('revenue', 'economic', drift=0.01, noise=0.02),
+        Constituent('margin', 'economic', start=2.0, noise=0.5, base=0.1, coupling=(('training', 0.002),)),
+        Constituent('training', 'social', invest_exponent=1),
+        Constituent('retention', 'social', invest_exponent=0.5, base=0.3),
+        Constituent('emissions', 'environmental', base=0, invest_exponent=1,
+                    coupling=(('revenue', 0.01), ('social', 0.05))),
+        Constituent('water', 'environmental', base=0.2, invest_exponent=2, coupling=(('economic', 0.03),)),
+    ), (('economic', 'uniform'), ('social', 'normal'), ('environmental', 'uniform')))
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_builtin_spec_matches_default(dtype):
+    default, spec = TBLSimulator(dtype), TBLSimulator(dtype, spec=ModelSpec.builtin())
+    assert np.array_equal(spec.ensemble_paths(120, 0.1, 16), default.ensemble_paths(120, 0.1, 16))
+    assert np.array_equal(spec.standard_run(60, 0.2).scores, default.standard_run(60, 0.2).scores)
+
+
+def test_builtin_spec_follows_params():
+    params = TBLParams(econ_drift=0.03, econ_volatility=0.02, env_coupling=0.1)
+    default = TBLSimulator(params=params)
+    spec = TBLSimulator(spec=ModelSpec.builtin(params))
+    assert np.array_equal(spec.ensemble_paths(60, 0.1, 4), default.ensemble_paths(60, 0.1, 4))
+
+
+def test_round_trip():
+    spec = coupled_spec()
+    assert ModelSpec.from_dict(spec.to_dict()) == spec
+    assert ModelSpec.from_dict(ModelSpec.builtin().to_dict()) == ModelSpec.builtin()
+
+
+@pytest.mark.parametrize('data, match', [
+    ({'constituents': [{'name': 'a', 'pillar': 'social', 'colour': 1}]}, 'colour'),
+    ({'constituents': [{'pillar': 'social'}]}, 'name'),
+    ({'constituents': [], 'coupling': {}}, 'coupling'),
+    ({'constituents': [], 'distributions': {'eco': 'normal'}}, 'eco'),
+])
+def test_from_dict_names_bad_fields(data, match):
+    with pytest.raises(ValueError, match=match):
+        ModelSpec.from_dict(data)
+
+
+@pytest.mark.parametrize('extra, match', [
+    (Constituent('revenue', 'social'), 'unique'),
+    (Constituent('social', 'social'), 'pillar names'),
+    (Constituent('x', 'social', coupling=(('nowhere', 1.0),)), 'nowhere'),
+    (Constituent('x', 'social', coupling=(('emissions', 1.0),)), 'cycle'),
+    (Constituent('x', 'social', coupling=(('retention', 1.0),)), 'itself'),
+])
+def test_invalid_specs(extra, match):
+    spec = coupled_spec()
+    with pytest.raises(ValueError, match=match):
+        TBLSimulator(spec=ModelSpec(spec.constituents + (extra,), spec.distributions))
+
+
+def test_coupling_matrix_columns():
+    spec = coupled_spec()
+    matrix = spec.coupling_matrix()
+    assert matrix.shape == (6, len(PILLARS) + 6)
+    assert matrix[4, PILLARS.index('social')] == 0.05
+    assert matrix[4, len(PILLARS) + 0] == 0.01
+    assert matrix[1, len(PILLARS) + 2] == 0.002
+
+
+def test_coupling_override_matches_params():
+    sim = TBLSimulator()
+    draws = sim._draw(sim._streams(1), 59, 4)
+    overridden = sim._advance(sim._initial_state(), *draws, 0.1, {('environmental', 'social'): 0.08})
+    expected = TBLSimulator(params=TBLParams(env_coupling=0.08))._advance(sim._initial_state(), *draws, 0.1)
+    assert all(np.array_equal(a, b) for a, b in zip(overridden, expected))
+    with pytest.raises(ValueError, match='no economic -> environmental'):
+        sim._advance(sim._initial_state(), *draws, 0.1, {('environmental', 'economic'): 0.1})
+
+
+def test_sensitivity_reproduces_ensemble():
+    scores = sensitivity.evaluate({'invest_rate': [0.1]}, months=60, n_paths=8)
+    paths = TBLSimulator().ensemble_paths(60, 0.1, 8)
+    assert scores['environmental'][0] == pytest.approx(paths[2, :, -1].mean(), rel=1e-12)
+
+
+def test_custom_spec_streams_and_selects():
+    sim = TBLSimulator(spec=coupled_spec())
+    bulk = sim.ensemble_paths(90, 0.1, 4)
+    chunks = np.concatenate([p for _, p in sim.stream_paths(90, 0.1, 4, chunk_months=25)], axis=-1)
+    assert np.array_equal(chunks, bulk)
+    selected = sim.select_run(90, 0.1, ['emissions', 'environmental'], n_paths=4)
+    assert np.array_equal(selected[1], bulk[2])
+
+
+@pytest.mark.parametrize('name', ['python', 'numpy',
+                                  pytest.param('numba', marks=requires_numba),
+                                  pytest.param('tensorflow', marks=requires_tf)])
+@pytest.mark.parametrize('spec', [None, coupled_spec()], ids=['builtin', 'custom'])
+def test_backends_match_python_loop(name, spec):
+    sim = TBLSimulator(spec=spec)
+    assert name in backends.available(sim)
+    report = benchmark.check_equivalence(60, 0.1, names=[name], sim=sim)
+    label = backends.registered(name).label
+    if name != 'python':
+        assert report[label]['ok'], report
+
+
+@requires_numba
+@pytest.mark.parametrize('spec', [None, coupled_spec()], ids=['builtin', 'custom'])
+def test_numba_matches_numpy(spec):
+    sim = TBLSimulator(spec=spec)
+    np.testing.assert_allclose(sim.numba_paths(120, 0.1, 8), sim.ensemble_paths(120, 0.1, 8), rtol=1e-12)
+    if spec is None:
+        assert np.array_equal(sim.numba_paths(120, 0.1, 8), sim.ensemble_paths(120, 0.1, 8))
+
+
+@requires_tf
+def test_tensorflow_runs_custom_spec():
+    sim = TBLSimulator(spec=coupled_spec())
+    paths = sim.tensorflow_paths(60, 0.1, 4)
+    assert paths.shape == (3, 4, 60) and np.isfinite(paths).all()
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio import run_portfolio, simulate_chunk
+from tbl_model import PILLARS, TBLSimulator
+
+
+@pytest.fixture
+def companies(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 23
+    frame = pd.DataFrame({
+        'company': [f'co{i}' for i in range(n)],
+        'invest_rate': rng.uniform(0, 0.3, n),
+        'months': rng.integers(1, 90, n).astype(float),
+        'carbon_footprint': rng.uniform(0.5, 2.0, n),
+    })
+    frame.loc[[2, 7], 'months'] = np.nan
+    frame.loc[[3, 11], 'carbon_footprint'] = np.nan
+    path = tmp_path / 'companies.csv'
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_chunked_matches_whole(companies):
+    whole = pd.concat(run_portfolio(str(companies), chunk_size=1000))
+    chunked = pd.concat(run_portfolio(str(companies), chunk_size=4))
+    assert len(whole) == len(chunked) == 23
+    exact = [c for c in whole.columns if not c.endswith('_mean')]
+    pd.testing.assert_frame_equal(whole[exact].reset_index(drop=True), chunked[exact].reset_index(drop=True),
+                                  check_exact=True)
+    means = [c for c in whole.columns if c.endswith('_mean')]
+    np.testing.assert_allclose(whole[means].to_numpy(), chunked[means].to_numpy(), rtol=1e-12)
+
+
+def test_company_matches_numpy_run(companies):
+    frame = pd.read_csv(companies)
+    summary = pd.concat(run_portfolio(str(companies), chunk_size=5)).reset_index(drop=True)
+    for row in (0, 2, 3, 11):
+        sim = TBLSimulator()
+        if not np.isnan(frame.loc[row, 'carbon_footprint']):
+            sim.env_factors = dict(sim.env_factors, carbon_footprint=frame.loc[row, 'carbon_footprint'])
+        months = 120 if np.isnan(frame.loc[row, 'months']) else int(frame.loc[row, 'months'])
+        run = sim.numpy_run(months, frame.loc[row, 'invest_rate'], np.random.SeedSequence(42, spawn_key=(row,)))
+        for name, pillar in zip(PILLARS, run.scores):
+            assert summary.loc[row, f'{name}_final'] == pytest.approx(pillar[-1], rel=1e-12)
+            assert summary.loc[row, f'{name}_mean'] == pytest.approx(pillar.mean(), rel=1e-12)
+
+
+def test_missing_invest_rate_lists_rows():
+    chunk = pd.DataFrame({'invest_rate': [0.1, np.nan, 0.2, None]})
+    with pytest.raises(ValueError, match=r'rows \[11, 13\]'):
+        simulate_chunk(chunk, first_row=10)
+
+
+def test_empty_chunk():
+    summary = simulate_chunk(pd.DataFrame({'invest_rate': []}))
+    assert summary.empty
+    assert list(summary.columns) == list(simulate_chunk(pd.DataFrame({'invest_rate': [0.1]})).columns)
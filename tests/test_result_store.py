@@ -0,0 +1,50 @@
+import multiprocessing
+import time
+
+import numpy as np
+
+from result_store import ResultStore, result_key
+from tbl_model import ModelSpec, TBLParams, TBLSimulator
+
+
+def _compute_once(path, key, log):
+    def compute():
+        with open(log, 'a') as f:
+            f.write('computed\n')
+        time.sleep(0.5)
+        return TBLSimulator().numpy_run(24, 0.1)
+    return ResultStore(path, poll_seconds=0.02).get_or_compute(key, compute).scores
+
+
+def test_get_or_compute_runs_once_across_processes(tmp_path):
+    path, log = str(tmp_path / 'store.sqlite'), tmp_path / 'computed.log'
+    key = result_key('run', TBLSimulator(), months=24, invest_rate=0.1)
+    ResultStore(path)
+    with multiprocessing.get_context('spawn').Pool(4) as pool:
+        results = pool.starmap(_compute_once, [(path, key, str(log))] * 4)
+    assert log.read_text().count('computed') == 1
+    expected = TBLSimulator().numpy_run(24, 0.1).scores
+    assert all(np.array_equal(r, expected) for r in results)
+
+
+def test_release_lets_another_process_compute(tmp_path):
+    store, other = ResultStore(str(tmp_path / 'store.sqlite')), ResultStore(str(tmp_path / 'store.sqlite'))
+    assert store.claim('k') is None
+    store.release('k')
+    assert other.claim('k') is None
+    other.put('k', np.arange(3))
+    assert np.array_equal(store.get('k'), np.arange(3))
+
+
+def test_key_depends_on_constituent_order():
+    sim, reordered = TBLSimulator(), TBLSimulator()
+    reordered.env_factors = dict(reversed(list(reordered.env_factors.items())))
+    assert result_key('run', sim, months=12) == result_key('run', TBLSimulator(), months=12)
+    assert result_key('run', sim, months=12) != result_key('run', reordered, months=12)
+
+
+def test_key_depends_on_params_and_spec():
+    base = result_key('run', TBLSimulator(), months=12)
+    assert base != result_key('run', TBLSimulator(params=TBLParams(env_coupling=0.06)), months=12)
+    assert base != result_key('run', TBLSimulator(spec=ModelSpec.builtin()), months=12)
+    assert base != result_key('run', TBLSimulator(), months=13)
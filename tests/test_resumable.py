@@ -0,0 +1,29 @@
+import json
+
+import numpy as np
+import pytest
+
+from tbl_model import SimulationCheckpoint, TBLSimulator
+
+
+def test_extend_matches_longer_run():
+    sim = TBLSimulator()
+    head, checkpoint = sim.resumable_run(60, 0.1)
+    tail, checkpoint = sim.extend(checkpoint, 150)
+    full = sim.numpy_run(150, 0.1)
+    assert np.array_equal(np.concatenate([head.scores, tail.scores], axis=-1), full.scores)
+    assert np.array_equal(tail.month, np.arange(61, 151))
+
+
+def test_extend_ensemble_through_json_checkpoint():
+    sim = TBLSimulator()
+    head, checkpoint = sim.resumable_run(40, 0.2, n_paths=5)
+    checkpoint = SimulationCheckpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict())))
+    tail, _ = sim.extend(checkpoint, 90)
+    assert np.array_equal(np.concatenate([head, tail], axis=-1), sim.ensemble_paths(90, 0.2, 5))
+
+
+def test_extend_rejects_shorter_horizon():
+    _, checkpoint = TBLSimulator().resumable_run(60, 0.1)
+    with pytest.raises(ValueError):
+        TBLSimulator().extend(checkpoint, 60)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from tbl_model import TBLSimulator
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+@pytest.mark.parametrize('chunk_months', [1, 7, 50, 120])
+def test_stream_paths_match_bulk(dtype, chunk_months):
+    sim = TBLSimulator(dtype)
+    bulk = sim.ensemble_paths(120, 0.1, 8, random_seed=3)
+    chunks = [paths for _, paths in sim.stream_paths(120, 0.1, 8, chunk_months, random_seed=3)]
+    assert np.array_equal(np.concatenate(chunks, axis=-1), bulk)
+
+
+def test_stream_months_are_contiguous():
+    months = np.concatenate([m for m, _ in TBLSimulator().stream_paths(100, 0.1, 2, chunk_months=30)])
+    assert np.array_equal(months, np.arange(1, 101))
+
+
+def test_stream_run_matches_numpy_run():
+    sim = TBLSimulator()
+    chunks = list(sim.stream_run(240, 0.2, chunk_months=60))
+    assert np.array_equal(np.concatenate([c.scores for c in chunks], axis=-1), sim.numpy_run(240, 0.2).scores)
+
+
+def test_summary_run_matches_trajectory():
+    sim = TBLSimulator()
+    scores = sim.numpy_run(240, 0.1).scores
+    summary = sim.summary_run(240, 0.1, chunk_months=50)
+    for name, pillar in zip(('economic', 'social', 'environmental'), scores):
+        assert summary[name]['final'] == pillar[-1]
+        assert summary[name]['min'] == pillar.min()
+        assert summary[name]['max'] == pillar.max()
+        assert summary[name]['mean'] == pytest.approx(pillar.mean(), rel=1e-12)